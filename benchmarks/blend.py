@@ -0,0 +1,100 @@
+""" Measure the speed of objects generation.
+
+Run from the repository root::
+
+    python -m benchmarks.blend [count]
+
+"""
+import datetime
+import decimal
+import sys
+import timeit
+
+from mixer.main import Mixer
+
+
+class Scheme:
+
+    """ A plain scheme. """
+
+    id = int
+    name = str
+    title = str
+    score = float
+    active = bool
+    price = decimal.Decimal
+    created_at = datetime.datetime
+
+
+class Parent:
+
+    """ A plain scheme with a relation. """
+
+    name = str
+    child = Scheme
+
+
+def bench(name, func, count):
+    """ Run `func` `count` times and print a rate. """
+    func()
+    seconds = timeit.timeit(func, number=count)
+    print('%-24s %10.0f objects/sec' % (name, count / seconds))
+
+
+def bench_main(count):
+    mixer = Mixer()
+    bench('main', lambda: mixer.blend(Scheme), count)
+    bench('main (relations)', lambda: mixer.blend(Parent, child__name='test'), count)
+
+
+def bench_django(count):
+    try:
+        from tests.django_app import models
+        from django.core.management import call_command
+        from mixer.backend.django import Mixer as DjangoMixer
+    except ImportError:
+        return
+
+    call_command('migrate', interactive=False, verbosity=0)
+    mixer = DjangoMixer(commit=False)
+    bench('django', lambda: mixer.blend(models.Client), count)
+    bench('django (relations)', lambda: mixer.blend(models.Message), count)
+
+
+def bench_sqlalchemy(count):
+    try:
+        from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Boolean
+        from sqlalchemy.ext.declarative import declarative_base
+        from sqlalchemy.orm import relationship
+        from mixer.backend.sqlalchemy import Mixer as SQLAlchemyMixer
+    except ImportError:
+        return
+
+    base = declarative_base()
+
+    class Profile(base):
+        __tablename__ = 'profile'
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(20), nullable=False)
+
+    class User(base):
+        __tablename__ = 'user'
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(10), nullable=False)
+        active = Column(Boolean, nullable=False)
+        created_at = Column(DateTime, nullable=False)
+        profile_id = Column(Integer, ForeignKey('profile.id'), nullable=False)
+        profile = relationship(Profile)
+
+    mixer = SQLAlchemyMixer(commit=False)
+    bench('sqlalchemy', lambda: mixer.blend(Profile), count)
+    bench('sqlalchemy (relations)', lambda: mixer.blend(User), count)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    bench_main(count)
+    bench_django(count)
+    bench_sqlalchemy(count)
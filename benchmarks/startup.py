@@ -0,0 +1,46 @@
+""" Measure the time of `import mixer` and of the first generated object.
+
+Every sample is taken in a fresh interpreter. Run from the repository root::
+
+    python -m benchmarks.startup [count]
+
+"""
+import statistics
+import subprocess
+import sys
+
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import mixer.main
+print(time.perf_counter() - start)
+"""
+
+FIRST_BLEND = """
+import time
+start = time.perf_counter()
+from mixer.main import mixer
+
+class Scheme:
+    id = int
+    name = str
+
+mixer.blend(Scheme)
+print(time.perf_counter() - start)
+"""
+
+
+def bench(name, code, count):
+    """ Run `code` in `count` interpreters and print the median time. """
+    samples = [
+        float(subprocess.check_output([sys.executable, '-c', code]))
+        for _ in range(count)
+    ]
+    print('%-24s %10.1f ms' % (name, statistics.median(samples) * 1000))
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    bench('import mixer.main', IMPORT, count)
+    bench('import and blend', FIRST_BLEND, count)
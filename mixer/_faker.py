@@ -1,15 +1,155 @@
-""" Integrate Faker to the Mixer. """
+""" Integrate Faker to the Mixer.
+
+Faker's providers are loaded on the first call of a formatter, so
+`import mixer` doesn't pay for providers which a test never uses.
+
+A locale and a random state of the faker are local to a context (a thread
+or an async task), so threads generate values concurrently without locks
+and don't switch locales of each other. The main thread draws from Faker's
+shared random state (so `faker.seed(n)` works as in Faker), the other
+threads have own random states.
+
+"""
+import datetime as dt
 import decimal as dc
 import locale as pylocale
+import random
+import string
+import sys
+import threading
+import time
+import uuid as pyuuid
+import weakref
 from collections import defaultdict
+from contextvars import ContextVar
 
 from faker import Factory, Generator
-from random import randint
+from faker.generator import random as shared_random
 from faker.config import DEFAULT_LOCALE, AVAILABLE_LOCALES, PROVIDERS
 from faker.providers import BaseProvider
 
 SMALLINT = 32767  # Safe in most databases according to Django docs
 
+EPOCH = dt.datetime(1970, 1, 1)
+
+# Random bytes are translated to letters, bytes over the last multiple of
+# the alphabet's size are dropped, so all letters are equiprobable
+LETTERS_TABLE = bytes(
+    ord(string.ascii_letters[num % len(string.ascii_letters)]) for num in range(256))
+LETTERS_REJECT = bytes(range(256 - 256 % len(string.ascii_letters), 256))
+LETTERS_BUFFER = 4096
+
+# Random state -> [buffer of random letters, position]
+_LETTERS = weakref.WeakKeyDictionary()
+
+BYTES_BUFFER = 1 << 16
+
+# Random state -> [buffer of random bytes, position]
+_BYTES = weakref.WeakKeyDictionary()
+
+# Larger values are sliced from a pre-filled buffer
+BLOB_MIN_SIZE = 1 << 10
+BLOB_BUFFER = 1 << 22
+
+# Random state -> a buffer of random bytes
+_BLOBS = weakref.WeakKeyDictionary()
+
+# Version 4 and RFC 4122 variant bits of UUIDs
+UUID4_MASK = ~(0xf000 << 64 | 0xc000 << 48) & (1 << 128) - 1
+UUID4_BITS = 0x4000 << 64 | 0x8000 << 48
+
+
+def draw_bytes(rnd, size, view=False):
+    """ Get random bytes from a buffer of the random state.
+
+    The buffer is drawn at once (so seeded random states give the same
+    bytes), buffers are kept by random states. The buffer is never
+    changed, a new one is drawn when it's used up.
+
+    :param view: Get a read-only memoryview of the buffer instead of a copy
+
+    :return bytes: bytes or memoryview
+
+    """
+    try:
+        buffer = _BYTES[rnd]
+    except KeyError:
+        buffer = _BYTES[rnd] = [b'', 0]
+
+    data, pos = buffer
+    if pos + size > len(data):
+        length = max(BYTES_BUFFER, size)
+        data, pos = rnd.getrandbits(length * 8).to_bytes(length, 'little'), 0
+        buffer[0] = data
+
+    buffer[1] = pos + size
+    if view:
+        return memoryview(data)[pos:pos + size]
+    return data[pos:pos + size]
+
+
+def sample_bytes(rnd, size, view=False):
+    """ Get random bytes from a pre-filled buffer at a random offset.
+
+    The buffer is drawn once per random state and values overlap in it,
+    so a value costs a slice (a memoryview is made in O(1)), but values are
+    not independent. Values larger than the buffer are drawn.
+
+    :param view: Get a read-only memoryview of the buffer instead of a copy
+
+    :return bytes: bytes or memoryview
+
+    """
+    if size > BLOB_BUFFER:
+        data = rnd.getrandbits(size * 8).to_bytes(size, 'little')
+        return memoryview(data) if view else data
+
+    data = _BLOBS.get(rnd)
+    if data is None:
+        data = _BLOBS[rnd] = rnd.getrandbits(BLOB_BUFFER * 8).to_bytes(BLOB_BUFFER, 'little')
+
+    pos = rnd.randrange(BLOB_BUFFER - size + 1)
+    if view:
+        return memoryview(data)[pos:pos + size]
+    return data[pos:pos + size]
+
+
+def format_uuid4(data):
+    """ Make a UUID string of version 4 from 16 random bytes.
+
+    :return str:
+
+    """
+    value = '%032x' % (int.from_bytes(data, 'big') & UUID4_MASK | UUID4_BITS)
+    return '%s-%s-%s-%s-%s' % (value[:8], value[8:12], value[12:16], value[16:20], value[20:])
+
+
+def decimal_bounds(left, right, positive=False, min_value=None, max_value=None):
+    """ Get bounds of decimals' digits as integers scaled by `right` places.
+
+    Numbers have `left` integer and `right` fraction digits. When only one
+    of `min_value`, `max_value` is set, the other bound is at the same
+    distance from it.
+
+    :return tuple: (low, high) inclusive
+
+    """
+    span = 10 ** (left + right) - 1
+    low, high = (1 if positive else -span), span
+    if min_value is not None:
+        low = int(dc.Decimal(min_value).scaleb(right).to_integral_value(dc.ROUND_CEILING))
+        high = low + span if max_value is None else high
+
+    if max_value is not None:
+        high = int(dc.Decimal(max_value).scaleb(right).to_integral_value(dc.ROUND_FLOOR))
+        low = high - span if min_value is None else low
+
+    if low > high:
+        raise ValueError('Empty range of decimals: %s..%s' % (min_value, max_value))
+
+    return low, high
+
+
 GENRES = ('general', 'pop', 'dance', 'traditional', 'rock', 'alternative', 'rap', 'country',
           'jazz', 'gospel', 'latin', 'reggae', 'comedy', 'historical', 'action', 'animation',
           'documentary', 'family', 'adventure', 'fantasy', 'drama', 'crime', 'horror', 'music',
@@ -24,6 +164,7 @@ class MixerProvider(BaseProvider):
     def __init__(self, generator):
         self.providers = []
         self.generator = generator
+        self.loaded = False
 
     def load(self, providers=PROVIDERS, locale=None):
         if locale is None:
@@ -36,6 +177,8 @@ class MixerProvider(BaseProvider):
             provider.__lang__ = lang_found
             self.generator.add_provider(provider)
 
+        self.loaded = True
+
     def big_integer(self):
         """ Get a big integer.
 
@@ -60,15 +203,23 @@ class MixerProvider(BaseProvider):
 
         return self.generator.ipv4() if self.generator.boolean() else self.generator.ipv6()
 
-    def small_decimal(self, left_digits=None, right_digits=None, **kwargs):
-        return self.generator.pydecimal(
-            left_digits=left_digits or randint(1, 10),
-            right_digits=right_digits or randint(1, 10),
-            **kwargs)
+    def small_decimal(self, left_digits=None, right_digits=None, positive=False,
+                      min_value=None, max_value=None):
+        """ Get a decimal with `left_digits` and `right_digits` (1-10 if not set).
+
+        A value is an integer draw scaled by the fraction digits, so it
+        costs one `randint` and doesn't pass through floats.
+
+        """
+        rnd = self.generator.random
+        left = rnd.randint(1, 10) if left_digits is None else left_digits
+        right = rnd.randint(1, 10) if right_digits is None else right_digits
+        low, high = decimal_bounds(left, right, positive, min_value, max_value)
+        return dc.Decimal(rnd.randint(low, high)).scaleb(-right)
 
-    def positive_decimal(self, **kwargs):
+    def positive_decimal(self, *args, **kwargs):
         """ Get a positive decimal. """
-        return self.small_decimal(positive=True, **kwargs)
+        return self.small_decimal(*args, positive=True, **kwargs)
 
     def positive_integer(self, max=2147483647):  # noqa
         """ Get a positive integer. """
@@ -82,15 +233,26 @@ class MixerProvider(BaseProvider):
         """ Get a positive integer. """
         return self.random_int(0, max=max)  # noqa
 
-    @staticmethod
-    def uuid():
-        import uuid
-        return str(uuid.uuid1())
+    def uuid(self, version=4):
+        """ Get a UUID string.
+
+        UUIDs of version 4 are made of random bytes of a buffer, so seeded
+        random states give the same UUIDs. Version 1 (time and host
+        based) is supported for compatibility.
+
+        """
+        if version == 1:
+            return str(pyuuid.uuid1())
+
+        if version != 4:
+            raise ValueError('Unsupported UUID version: %s' % version)
+
+        return format_uuid4(draw_bytes(self.generator.random, 16))
 
     def json(self):
         """Generate random dict with str keys and int values.
         """
-        return dict((self.pystr(), self.random_int()) for _ in range(10))
+        return dict((self.generator.pystr(), self.random_int()) for _ in range(10))
 
     def genre(self):
         return self.random_element(GENRES)
@@ -109,25 +271,275 @@ class MixerProvider(BaseProvider):
         return (self.generator.latitude(), self.generator.longitude())
 
     def pybytes(self, size=20):
-        return self.pystr(size).encode('utf-8')
+        return self.generator.pystr(size).encode('utf-8')
+
+    def random_bytes(self, size=20, view=False):
+        """ Get random bytes.
+
+        :param size: A number of bytes, (min, max) for uniform sizes or
+                     a function which gets the random state and returns
+                     a size (e.g. `lambda rnd: int(rnd.expovariate(1e-4))`)
+        :param view: Get a read-only memoryview of a shared random buffer
+                     instead of a copy
+
+        Values up to 1 KiB are independent (see :func:`draw_bytes`), larger
+        ones are sliced from a pre-filled buffer (see :func:`sample_bytes`).
+
+        """
+        rnd = self.generator.random
+        if isinstance(size, tuple):
+            size = rnd.randint(*size)
+        elif callable(size):
+            size = size(rnd)
+
+        if size > BLOB_MIN_SIZE:
+            return sample_bytes(rnd, size, view)
+        return draw_bytes(rnd, size, view)
+
+    # Fabrics of simple types draw from the random state directly, they are
+    # much faster than Faker's formatters with the same results
+
+    def random_string(self, length=20):
+        """ Get a string of ASCII letters as `pystr`.
+
+        Strings are sliced from a buffer of random letters, which is drawn
+        from random bytes at once. Buffers are kept by random states, so
+        seeded streams stay independent.
+
+        """
+        rnd = self.generator.random
+        try:
+            buffer = _LETTERS[rnd]
+        except KeyError:
+            buffer = _LETTERS[rnd] = ['', 0]
+
+        text, pos = buffer
+        if pos + length > len(text):
+            text, pos = '', 0
+            size = max(LETTERS_BUFFER, length)
+            while len(text) < length:
+                text += rnd.getrandbits(size * 8).to_bytes(size, 'little').translate(
+                    LETTERS_TABLE, LETTERS_REJECT).decode('ascii')
+            buffer[0] = text
+
+        buffer[1] = pos + length
+        return text[pos:pos + length]
+
+    def random_float(self):
+        """ Get a float as `pyfloat`: 1-14 fraction digits, 15 digits at all. """
+        rnd = self.generator.random
+        right = rnd.randint(1, sys.float_info.dig - 1)
+        number = rnd.randrange(10 ** (sys.float_info.dig - right))
+        value = float('%d.%0*d' % (number, right, rnd.randrange(10 ** right)))
+        return value if rnd.random() < 0.5 else -value
+
+    def random_datetime(self):
+        """ Get a datetime from 1970-01-01 to now as `date_time`. """
+        return EPOCH + dt.timedelta(seconds=self.generator.random.randint(0, int(time.time())))
+
+    def random_date(self):
+        """ Get a date from 1970-01-01 to today as `date` (a string). """
+        days = self.generator.random.randint(0, int(time.time() // 86400))
+        return dt.date.fromordinal(EPOCH.toordinal() + days).isoformat()
+
+    def random_time(self):
+        """ Get a time of a day as `time` (a string). """
+        minutes, seconds = divmod(self.generator.random.randrange(86400), 60)
+        return '%02d:%02d:%02d' % (divmod(minutes, 60) + (seconds,))
+
+
+class LazyFormatter(object):
+
+    """ Call a formatter of the generator's current locale.
+
+    Providers of the locale are loaded on the first call.
+
+    """
+
+    __slots__ = 'generator', 'name', 'cache'
+
+    def __init__(self, generator, name):
+        self.generator = generator
+        self.name = name
+        self.cache = (None, None)
+
+    def __call__(self, *args, **kwargs):
+        # The cache is replaced at once, threads never see a half of it
+        env, method = self.cache
+        if env is not self.generator.env:
+            env = self.generator.env
+            method = self.generator.get_formatter(self.name)
+            self.cache = env, method
+        return method(*args, **kwargs)
+
+    def __reduce__(self):
+        return getattr, (self.generator, self.name)
+
+    def __repr__(self):
+        return '<formatter %s>' % self.name
+
+    @property
+    def __name__(self):
+        return self.name
+
+
+class _Context(object):
+
+    """ A locale and a random state of a thread or an async task.
+
+    A context without own locale follows the default one.
+
+    """
+
+    __slots__ = 'locale', 'env', 'random', 'default'
+
+    def __init__(self, locale, env, random, default=False):
+        self.locale = locale
+        self.env = env
+        self.random = random
+        self.default = default
 
 
 class MixerGenerator(Generator):
 
-    """ Support dynamic locales switch. """
+    """ Support dynamic locales switch and lazy loading of providers.
+
+    The locale and the random state are context-local. A context uses the
+    default locale (`locale` param, see :meth:`set_default_locale`) until
+    its own locale is set. The main thread starts with Faker's shared random
+    state (see :meth:`Generator.seed`), other threads with their own ones.
+
+    """
 
     def __init__(self, locale=DEFAULT_LOCALE, providers=PROVIDERS, **config):
-        self._locale = None
         self._envs = defaultdict(self.__create_env)
-        self.locale = locale
+        self._formatters = dict()
+        self._pnames = list(providers)
+        self._lock = threading.Lock()
+        self._context = ContextVar('mixer_faker', default=None)
+        self._locale = self.normalize_locale(locale)
         super(MixerGenerator, self).__init__(**config)
-        self.env.load(providers)
 
     def __create_env(self):
         return MixerProvider(self)
 
+    def __reduce__(self):
+        if self is faker:
+            return 'faker'
+        return MixerGenerator, (self._locale, self._pnames)
+
     def __getattr__(self, name):
-        return getattr(self.env, name)
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        if hasattr(MixerProvider, name):
+            return getattr(self.env, name)
+
+        # Formatters of Faker's providers are given out by names, so the
+        # providers aren't loaded until a formatter is called
+        try:
+            return self._formatters[name]
+        except KeyError:
+            with self._lock:
+                formatter = self._formatters.setdefault(name, LazyFormatter(self, name))
+            return formatter
+
+    def __get_context(self):
+        context = self._context.get()
+        if context is None:
+            rnd = shared_random if threading.current_thread() is threading.main_thread() \
+                else random.Random()
+            return self.__set_context(self._locale, rnd, True)
+
+        if context.default and context.locale != self._locale:
+            return self.__set_context(self._locale, context.random, True)
+
+        return context
+
+    def __set_context(self, locale, rnd, default=False):
+        with self._lock:
+            env = self._envs[locale]
+        context = _Context(locale, env, rnd, default)
+        self._context.set(context)
+        return context
+
+    @staticmethod
+    def normalize_locale(value):
+        """ Get a locale's name known by Faker (or the default one).
+
+        :return str:
+
+        """
+        value = pylocale.normalize(value.replace('-', '_')).split('.')[0]
+        if value not in AVAILABLE_LOCALES:
+            value = DEFAULT_LOCALE
+        return value
+
+    def get_formatter(self, formatter):
+        """ Get a formatter of the current locale, load providers if needed.
+
+        :return function:
+
+        """
+        env = self.env
+        if not env.loaded:
+            with self._lock:
+                if not env.loaded:
+                    env.load(self._pnames)
+
+        try:
+            return getattr(env, formatter)
+        except AttributeError:
+            raise AttributeError('Unknown formatter %r with locale %r' % (formatter, self.locale))
+
+    def set_default_locale(self, value):
+        """ Set the locale of the contexts which haven't own locale.
+
+        The current context loses its own locale.
+
+        """
+        self._locale = self.normalize_locale(value)
+        self.__set_context(self._locale, self.random, True)
+
+    def seed(self, seed=None):
+        """ Seed Faker's shared random state and the state of the current context. """
+        shared_random.seed(seed)
+        if self.random is not shared_random:
+            self.random.seed(seed)
+
+    def seed_instance(self, seed=None):
+        """ Seed the random state of the current context.
+
+        :return MixerGenerator:
+
+        """
+        rnd = random.Random()
+        rnd.seed(seed)
+        self.random = rnd
+        self._is_seeded = True
+        return self
+
+    def swap_random(self, value):
+        """ Replace the random state of the current context in place.
+
+        Mixer swaps random streams of fields so (see :mod:`mixer.rng`),
+        it's cheaper than to set :attr:`random`.
+
+        :return: The previous random state
+
+        """
+        context = self.__get_context()
+        previous, context.random = context.random, value
+        return previous
+
+    @property
+    def random(self):
+        return self.__get_context().random
+
+    @random.setter
+    def random(self, value):
+        context = self.__get_context()
+        self.__set_context(context.locale, value, context.default)
 
     @property
     def providers(self):
@@ -139,27 +551,18 @@ class MixerGenerator(Generator):
 
     @property
     def locale(self):
-        return self._locale
+        return self.__get_context().locale
 
     @locale.setter
     def locale(self, value):
-        value = pylocale.normalize(value.replace('-', '_')).split('.')[0]
-        if value not in AVAILABLE_LOCALES:
-            value = DEFAULT_LOCALE
-
-        if value == self._locale:
-            return None
-
-        nenv = self._envs[value]
-        senv = self.env
-        self._locale = value
-
-        if senv.providers and not nenv.providers:
-            nenv.load([p.__provider__ for p in senv.providers], value)
+        value = self.normalize_locale(value)
+        context = self.__get_context()
+        if value != context.locale or context.default:
+            self.__set_context(value, context.random)
 
     @property
     def env(self):
-        return self._envs[self._locale]
+        return self.__get_context().env
 
     def set_formatter(self, name, method):
         if not hasattr(self.env, name):
@@ -36,6 +36,26 @@ class MixerProxy(object):
         :return instance:
 
         """
+        scheme, backend = cls.__load_backend(model)
+        return backend.blend(scheme, **params)
+
+    @classmethod
+    def blend_many(cls, model, count=5, **params):
+        """ Get a mixer class for model and generate a batch.
+
+        :return list:
+
+        """
+        scheme, backend = cls.__load_backend(model)
+        return backend.blend_many(scheme, count, **params)
+
+    @classmethod
+    def _blend_batches(cls, model, count, values, **params):
+        scheme, backend = cls.__load_backend(model)
+        return backend._blend_batches(scheme, count, values, **params) # noqa
+
+    @classmethod
+    def __load_backend(cls, model):
         scheme = cls.__load_cls(model)
         backend = cls.__store__.get(scheme)
 
@@ -52,7 +72,7 @@ class MixerProxy(object):
 
             cls.__store__[scheme] = backend
 
-        return backend.blend(scheme, **params)
+        return scheme, backend
 
     @staticmethod
     def __load_cls(cls_type):
@@ -3,16 +3,20 @@ from __future__ import absolute_import
 
 import datetime as dt
 import decimal
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
 from os import path
 from types import GeneratorType
 
+from asgiref.sync import sync_to_async
 from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation   # noqa
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import ContentFile
 from django.core.validators import validate_ipv4_address, validate_ipv6_address
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import signals
 
 from .. import mix_types as t, _compat as _
 from ..main import (
@@ -40,6 +44,9 @@ class UTCZone(dt.tzinfo):
 
 UTC = UTCZone()
 
+# Objects of the current bulk scope (see :meth:`Mixer.bulk`)
+_BULK = ContextVar('mixer_django_bulk', default=None)
+
 
 def get_file(filepath=MOCK_FILE, **kwargs):
     """ Generate a content file.
@@ -104,7 +111,7 @@ class GenFactory(BaseFactory):
     }
 
     generators = {
-        models.BinaryField: faker.pybytes,
+        models.BinaryField: faker.random_bytes,
         models.DateTimeField: get_datetime,
         models.FileField: get_file,
         models.FilePathField: lambda: MOCK_FILE,
@@ -166,8 +173,53 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
 
     factory = GenFactory
 
+    def blend(self, **values):
+        """ Generate object (in a bulk scope with `commit='bulk'`). """
+        with self.__bulk():
+            return super(TypeMixer, self).blend(**values)
+
+    def blend_many(self, count, values):
+        """ Generate a batch of objects (in a bulk scope with `commit='bulk'`). """
+        with self.__bulk():
+            return super(TypeMixer, self).blend_many(count, values)
+
     def postprocess(self, target, postprocess_values):
         """ Fill postprocess_values. """
+        self._fill_generic(target, postprocess_values)
+
+        if self.__mixer:
+            target = self.__mixer.postprocess(target)
+
+        self.__fill_relations(target, postprocess_values)
+        return target
+
+    def postprocess_many(self, targets):
+        """ Fill postprocess_values for a batch. """
+        for target, postprocess_values in targets:
+            self._fill_generic(target, postprocess_values)
+
+        result = [target for target, _ in targets]
+        if self.__mixer:
+            result = self.__mixer.postprocess_many(result)
+
+        for target, (_, postprocess_values) in zip(result, targets):
+            self.__fill_relations(target, postprocess_values)
+
+        return result
+
+    def __bulk(self):
+        if self.__mixer and self.__mixer.params.get('commit') == 'bulk':
+            return self.__mixer.bulk()
+        return nullcontext()
+
+    def __fill_relations(self, target, postprocess_values):
+        # Objects of a bulk scope get their relations when they are saved
+        mixer = self.__mixer
+        if postprocess_values and not (
+                mixer and mixer.defer(self._fill_relations, target, postprocess_values)):
+            self._fill_relations(target, postprocess_values)
+
+    def _fill_generic(self, target, postprocess_values):
         for name, deffered in postprocess_values:
             if not isinstance(deffered.scheme, GenericForeignKey):
                 continue
@@ -175,9 +227,7 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
             name, value = self._get_value(name, deffered.value)
             setattr(target, name, value)
 
-        if self.__mixer:
-            target = self.__mixer.postprocess(target)
-
+    def _fill_relations(self, target, postprocess_values):
         for name, deffered in postprocess_values:
 
             if isinstance(deffered.scheme, GenericForeignKey) or not target.pk:
@@ -202,9 +252,10 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
             if not isinstance(value, (list, tuple)):
                 value = [value]
 
-            getattr(target, name).set(value)
-
-        return target
+            if self.__mixer:
+                self.__mixer.set_relations(target, name, deffered.scheme, value)
+            else:
+                getattr(target, name).set(value)
 
     def get_value(self, name, value):
         """ Set value to generated instance.
@@ -273,6 +324,18 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
 
         return super(TypeMixer, self).gen_field(field)
 
+    def compile_field(self, field):
+        """ Compile generation of a value for the field.
+
+        :return function:
+
+        """
+        if isinstance(field.scheme, GenericForeignKey):
+            skip = field.name, SKIP_VALUE
+            return lambda values: skip
+
+        return super(TypeMixer, self).compile_field(field)
+
     def make_fabric(self, field, fname=None, fake=False, kwargs=None): # noqa
         """ Make a fabric for field.
 
@@ -302,7 +365,7 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
         if stype in (str, t.Text):
             fab = super(TypeMixer, self).make_fabric(
                 fcls, field_name=fname, fake=fake, kwargs=kwargs)
-            return lambda: fab()[:field.max_length]
+            return self.make_string_fabric(fab, field.max_length)
 
         if stype is decimal.Decimal:
             kwargs['left_digits'] = field.max_digits - field.decimal_places
@@ -334,10 +397,26 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
     def is_unique(field):
         """ Return True is field's value should be a unique.
 
+        Related objects are blended for each value, so they aren't checked
+        (objects of a bulk scope haven't primary keys and can't be hashed).
+
         :return bool:
 
         """
-        return field.scheme.unique
+        scheme = field.scheme
+        if isinstance(scheme, models.fields.related.RelatedField):
+            return scheme.unique and scheme.related_model is ContentType
+
+        return scheme.unique
+
+    @staticmethod
+    def is_relation(field):
+        """ Return True if field's value is a related model.
+
+        :return bool:
+
+        """
+        return isinstance(field.scheme, models.fields.related.RelatedField)
 
     @staticmethod
     def is_required(field):
@@ -413,12 +492,121 @@ class Mixer(BaseMixer):
     def __init__(self, commit=True, **params):
         """Initialize Mixer instance.
 
-        :param commit: (True) Save object to database.
+        :param commit: (True) Save object to database. With `'bulk'` objects
+                       are saved by batches with their relations
+                       (see :meth:`Mixer.bulk`).
 
         """
         super(Mixer, self).__init__(**params)
         self.params['commit'] = commit
 
+    async def ablend_many(self, scheme, count=5, **values):
+        """Generate a few instances of `scheme` without blocking the event loop.
+
+        Generation of Django models touches DB (relations, content types)
+        and the async ORM methods (`asave`, `abulk_create`) aren't available
+        in all supported versions of Django, so the objects are blended with
+        :meth:`Mixer.blend_many` in the thread of Django's sync code
+        (`sync_to_async`). Batches are saved one by one, `concurrency`
+        param isn't supported.
+
+        :return value: A list of generated instances
+
+        """
+        return await sync_to_async(self.blend_many)(scheme, count, **values)
+
+    def init_worker(self):
+        """ Don't share DB connections with the parent process.
+
+        In-memory SQLite databases aren't shared between processes, so
+        objects of the workers are saved by the parent process.
+
+        """
+        for conn in connections.all():
+            if conn.vendor == 'sqlite' and conn.is_in_memory_db():
+                self.params['commit'] = False
+            conn.connection = None
+
+    @contextmanager
+    def bulk(self):
+        """ Save objects generated in the scope at once.
+
+        Objects (related ones included) are saved at the end of the scope
+        in order of their relations (parents before children): objects of a
+        model are inserted with `bulk_create` when it's possible (see
+        :meth:`Mixer.postprocess_many`), then many-to-many relations are
+        inserted. Objects don't have primary keys in the scope.
+
+        With `commit='bulk'` each blended object or batch has own scope. ::
+
+            with mixer.bulk():
+                messages = mixer.cycle(1000).blend(Message, tags=mixer.RANDOM)
+
+        """
+        if self.__scope() is not None:
+            yield self
+            return
+
+        token = _BULK.set(_Bulk(self))
+        try:
+            yield self
+            self.flush()
+        finally:
+            _BULK.reset(token)
+
+    def flush(self):
+        """ Save objects of the current bulk scope. """
+        scope = self.__scope()
+        if scope is None:
+            return
+
+        with ExitStack() as stack:
+            atomic = set()
+            while scope.objects or scope.relations:
+                objects, scope.objects = scope.objects, []
+                self.__save(objects, stack, atomic)
+
+                # Relations could blend new objects (through models)
+                relations, scope.relations = scope.relations, []
+                for fill, args in relations:
+                    fill(*args)
+
+            for (through, field), pairs in scope.through.items():
+                rows = self.__make_through(through, field, pairs)
+                self.__save(rows, stack, atomic)
+
+            scope.through.clear()
+
+    def defer(self, func, *args):
+        """ Call the function when the objects of a bulk scope are saved.
+
+        :return bool: The call is deferred
+
+        """
+        scope = self.__scope()
+        if scope is None or not self.params.get('commit'):
+            return False
+
+        scope.relations.append((func, args))
+        return True
+
+    def set_relations(self, target, name, field, values):
+        """ Set many-to-many relations of a saved object.
+
+        In a bulk scope rows of auto-created through models are inserted at
+        once (when the relations don't have `m2m_changed` listeners).
+
+        """
+        scope = self.__scope()
+        through = field.remote_field.through
+        if scope is None or signals.m2m_changed.has_listeners(through):
+            getattr(target, name).set(values)
+            return
+
+        pairs = scope.through.setdefault((through, field), {})
+        for value in values:
+            pairs.setdefault((id(target), id(value)), (target, value))
+
     def postprocess(self, target):
         """ Save objects in db.
 
@@ -426,10 +614,128 @@ class Mixer(BaseMixer):
 
         """
         if self.params.get('commit'):
-            target.save()
+            scope = self.__scope()
+            if scope is None:
+                target.save()
+            else:
+                scope.objects.append(target)
 
         return target
 
+    def postprocess_many(self, targets):
+        """ Save a batch in one transaction.
+
+        The batch is inserted with `bulk_create` when the model hasn't
+        custom `save`, save signals and parents and the database returns
+        primary keys from bulk inserts.
+
+        :return list: targets
+
+        """
+        if not self.params.get('commit') or not targets:
+            return targets
+
+        scope = self.__scope()
+        if scope is not None:
+            scope.objects.extend(targets)
+            return targets
+
+        using = router.db_for_write(type(targets[0]))
+        with transaction.atomic(using=using):
+            self.__save_model(type(targets[0]), targets, using)
+
+        return targets
+
+    def __scope(self):
+        scope = _BULK.get()
+        if scope is not None and scope.mixer is self:
+            return scope
+        return None
+
+    def __save(self, objects, stack, atomic):
+        """ Save objects by models in order of their relations. """
+        for model, group in _order_by_relations(objects):
+            using = router.db_for_write(model)
+            if using not in atomic:
+                stack.enter_context(transaction.atomic(using=using))
+                atomic.add(using)
+
+            self.__save_model(model, group, using)
+
+    def __save_model(self, model, objects, using):
+        if self.__can_bulk_create(model, using):
+            model._default_manager.using(using).bulk_create(
+                objects, batch_size=self.params.get('batch_size'))
+
+        else:
+            for target in objects:
+                target.save(using=using)
+
+    @staticmethod
+    def __make_through(through, field, pairs):
+        source = through._meta.get_field(field.m2m_field_name()).attname
+        dest = through._meta.get_field(field.m2m_reverse_field_name()).attname
+        rows = dict()
+        for target, value in pairs.values():
+            key = target.pk, getattr(value, 'pk', value)
+            rows[key] = through(**{source: key[0], dest: key[1]})
+
+        return list(rows.values())
+
+    @staticmethod
+    def __can_bulk_create(model, using):
+        return (
+            connections[using].features.can_return_rows_from_bulk_insert and
+            model.save is models.Model.save and
+            not model._meta.parents and
+            not signals.pre_save.has_listeners(model) and
+            not signals.post_save.has_listeners(model))
+
+
+class _Bulk(object):
+
+    """ Objects of a bulk scope which aren't saved yet. """
+
+    def __init__(self, mixer):
+        self.mixer = mixer
+        self.objects = []
+        self.relations = []
+        self.through = dict()
+
+
+def _order_by_relations(objects):
+    """ Group objects by models in order of their relations.
+
+    Related objects are generated before the objects which refer to them,
+    so a level of an object (1 + the max level of its parents in the list)
+    is known when the object is met.
+
+    :return list: A list of (model, objects) with parents before children
+
+    """
+    levels = dict()
+    groups = dict()
+    fields = dict()
+    for obj in objects:
+        model = type(obj)
+        if model not in fields:
+            fields[model] = [
+                field for field in model._meta.concrete_fields
+                if field.is_relation and (field.many_to_one or field.one_to_one)]
+
+        level = 0
+        for field in fields[model]:
+            if field.is_cached(obj):
+                parent = levels.get(id(field.get_cached_value(obj)))
+                if parent is not None and parent >= level:
+                    level = parent + 1
+
+        levels[id(obj)] = level
+        groups.setdefault((level, model), []).append(obj)
+
+    return [(model, group) for (_, model), group in sorted(
+        groups.items(), key=lambda item: item[0][0])]
+
 
 # Default mixer
 mixer = Mixer()
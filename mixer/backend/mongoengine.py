@@ -24,6 +24,7 @@ from __future__ import absolute_import
 
 import datetime
 import decimal
+from collections import defaultdict
 
 from bson import ObjectId
 from mongoengine import (
@@ -105,9 +106,9 @@ def get_polygon(length=5, **kwargs):
 
 def get_generic_reference(_typemixer=None, **params):
     """ Choose a GenericRelation. """
-    meta = type(_typemixer)
+    cache = type(_typemixer).get_cache(_typemixer._TypeMixer__mixer) # noqa
     scheme = faker.random_element([
-        m for (_, m, _, _) in meta.mixers.keys()
+        m for (_, m, _, _), _ in cache.items()
         if issubclass(m, Document) and m is not _typemixer._TypeMixer__scheme # noqa
     ])
 
@@ -172,7 +173,7 @@ class TypeMixer(BaseTypeMixer):
         if ftype is StringField:
             fab = super(TypeMixer, self).make_fabric(
                 ftype, field_name=field_name, fake=fake, kwargs=kwargs)
-            return lambda: fab()[:me_field.max_length]
+            return self.make_string_fabric(fab, me_field.max_length)
 
         if ftype in (ListField, EmbeddedDocumentListField):
             fab = self.make_fabric(me_field.field, kwargs=kwargs)
@@ -217,6 +218,15 @@ class TypeMixer(BaseTypeMixer):
         """
         return field.scheme.unique
 
+    @staticmethod
+    def is_relation(field):
+        """ Return True if field's value is a referenced document.
+
+        :return bool:
+
+        """
+        return isinstance(field.scheme, (ReferenceField, GenericReferenceField))
+
     @staticmethod
     def is_required(field):
         """ Return True is field's value should be defined.
@@ -298,6 +308,39 @@ class Mixer(BaseMixer):
 
         return target
 
+    def postprocess_many(self, targets):
+        """ Insert a batch of documents at once.
+
+        Bulk inserts send `pre_bulk_insert`/`post_bulk_insert` signals
+        instead of the save signals.
+
+        :return list: targets
+
+        """
+        if not self.params.get('commit'):
+            return targets
+
+        documents = defaultdict(list)
+        for target in targets:
+            if isinstance(target, Document):
+                target.validate()
+                documents[type(target)].append(target)
+
+        for document, batch in documents.items():
+
+            # Generated ids mark the documents as saved, insert them as new
+            for target in batch:
+                target._created = True
+
+            document.objects.insert(batch, load_bulk=False)
+
+            # Mark the documents as saved, so `save` updates them later
+            for target in batch:
+                target._created = False
+                target._clear_changed_fields()
+
+        return targets
+
 
 mixer = Mixer()
 
@@ -35,8 +35,12 @@ def get_relation(_scheme=None, _typemixer=None, **params):
 
 
 def get_blob(**kwargs):
-    """ Generate value for BlobField. """
-    raise NotImplementedError
+    """ Generate value for BlobField.
+
+    See :meth:`mixer._faker.MixerProvider.random_bytes` for params.
+
+    """
+    return faker.random_bytes(**kwargs)
 
 
 class GenFactory(BaseFactory):
@@ -85,6 +89,17 @@ class TypeMixer(BaseTypeMixer):
             return field.name, SKIP_VALUE
         return super(TypeMixer, self).gen_field(field)
 
+    def compile_field(self, field):
+        """ Keep generation of primary keys depended on `commit` param.
+
+        :return function:
+
+        """
+        if isinstance(field.scheme, AutoField):
+            return lambda values: self.gen_field(field)
+
+        return super(TypeMixer, self).compile_field(field)
+
     def gen_select(self, field_name, select):
         """ Select exists value from database.
 
@@ -109,6 +124,15 @@ class TypeMixer(BaseTypeMixer):
         """
         return not field.scheme.null
 
+    @staticmethod
+    def is_relation(field):
+        """ Return True if field's value is a related model.
+
+        :return bool:
+
+        """
+        return isinstance(field.scheme, ForeignKeyField)
+
     def is_unique(self, field):
         """ Return True is field's value should be a unique.
 
@@ -197,6 +221,29 @@ class Mixer(BaseMixer):
 
         return target
 
+    def postprocess_many(self, targets):
+        """ Save a batch in one transaction.
+
+        The batch is inserted with `bulk_create` when the database returns
+        generated primary keys (or the keys aren't generated).
+
+        :return list: targets
+
+        """
+        if not self.params.get('commit') or not targets:
+            return targets
+
+        meta = targets[0]._meta
+        with meta.database.atomic():
+            if meta.database.returning_clause or not meta.auto_increment:
+                meta.model.bulk_create(targets)
+
+            else:
+                for target in targets:
+                    target.save()
+
+        return targets
+
 
 # Default Peewee mixer
 mixer = Mixer()
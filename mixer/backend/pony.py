@@ -7,6 +7,7 @@
 from __future__ import absolute_import
 
 from pony.orm import commit
+from pony.orm.core import EntityMeta
 
 from .. import mix_types as t
 from ..main import TypeMixer as BaseTypeMixer, Mixer as BaseMixer, SKIP_VALUE
@@ -32,6 +33,15 @@ class TypeMixer(BaseTypeMixer):
         """
         return field.scheme.is_required and not field.scheme.is_pk
 
+    @staticmethod
+    def is_relation(field):
+        """ Return True if field's value is a related entity.
+
+        :return bool:
+
+        """
+        return isinstance(field.scheme.py_type, EntityMeta)
+
     def is_unique(self, field):
         """ Return True is field's value should be a unique.
 
@@ -81,6 +91,17 @@ class Mixer(BaseMixer):
 
         return target
 
+    def postprocess_many(self, targets):
+        """ Save a batch in one commit.
+
+        :return list: targets
+
+        """
+        if self.params.get('commit'):
+            commit()
+
+        return targets
+
 
 # Default Pony mixer
 mixer = Mixer()
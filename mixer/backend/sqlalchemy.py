@@ -1,6 +1,7 @@
 """ SQLAlchemy support. """
 from __future__ import absolute_import
 
+import asyncio
 import datetime
 from types import GeneratorType
 
@@ -16,6 +17,10 @@ try:
     from sqlalchemy.orm.relationships import RelationshipProperty
 except ImportError:
     from sqlalchemy.orm.properties import RelationshipProperty
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ImportError:
+    AsyncSession = ()  # SQLAlchemy < 1.4 (isinstance checks are always False)
 from sqlalchemy.types import (
     BIGINT, BOOLEAN, BigInteger, Boolean, CHAR, DATE, DATETIME, DECIMAL, Date,
     DateTime, FLOAT, Float, INT, INTEGER, Integer, NCHAR, NVARCHAR, NUMERIC,
@@ -81,6 +86,36 @@ class TypeMixer(BaseTypeMixer):
 
     def postprocess(self, target, postprocess_values):
         """ Fill postprocess values. """
+        self._fill_relations(target, postprocess_values)
+
+        if self.__mixer:
+            target = self.__mixer.postprocess(target)
+
+        return target
+
+    def postprocess_many(self, targets):
+        """ Fill postprocess values for a batch. """
+        for target, postprocess_values in targets:
+            self._fill_relations(target, postprocess_values)
+
+        result = [target for target, _ in targets]
+        if self.__mixer:
+            result = self.__mixer.postprocess_many(result)
+
+        return result
+
+    async def apostprocess_many(self, targets):
+        """ Fill postprocess values for a batch and save it asynchronously. """
+        for target, postprocess_values in targets:
+            self._fill_relations(target, postprocess_values)
+
+        result = [target for target, _ in targets]
+        if self.__mixer:
+            result = await self.__mixer.apostprocess_many(result)
+
+        return result
+
+    def _fill_relations(self, target, postprocess_values):
         mixed = []
 
         for name, deffered in postprocess_values:
@@ -97,11 +132,6 @@ class TypeMixer(BaseTypeMixer):
         for name, mix in mixed:
             setattr(target, name, mix & target)
 
-        if self.__mixer:
-            target = self.__mixer.postprocess(target)
-
-        return target
-
     @staticmethod
     def get_default(field):
         """ Get default value from field.
@@ -160,6 +190,15 @@ class TypeMixer(BaseTypeMixer):
 
         return scheme.unique
 
+    @staticmethod
+    def is_relation(field):
+        """ Return True if field's value is a related model.
+
+        :return bool:
+
+        """
+        return isinstance(field.scheme, RelationshipProperty)
+
     def is_required(self, field):
         """ Return True is field's value should be defined.
 
@@ -228,7 +267,7 @@ class TypeMixer(BaseTypeMixer):
         if stype is str:
             fab = super(TypeMixer, self).make_fabric(
                 stype, field_name=field_name, fake=fake, kwargs=kwargs)
-            return lambda: fab()[:column.type.length]
+            return self.make_string_fabric(fab, column.type.length)
 
         if ftype is Enum:
             return partial(faker.random_element, column.type.enums)
@@ -309,6 +348,9 @@ class Mixer(BaseMixer):
 
         :param fake: (True) Generate fake data instead of random data.
         :param session: SQLAlchemy session. Using for commits.
+                        With an `AsyncSession` objects are committed by
+                        :meth:`Mixer.ablend` and :meth:`Mixer.ablend_many`
+                        (:meth:`Mixer.blend` only adds them to the session).
         :param commit: (True) Commit instance to session after creation.
 
         """
@@ -316,6 +358,16 @@ class Mixer(BaseMixer):
         self.params['session'] = session
         self.params['commit'] = bool(session) and commit
 
+    def __getstate__(self):
+        """ Sessions can't be sent to workers, objects are saved by the mixer. """
+        state = super(Mixer, self).__getstate__()
+        state['params'].update(session=None, commit=False)
+        return state
+
+    def init_worker(self):
+        """ Don't use the session of the parent process. """
+        self.params.update(session=None, commit=False)
+
     def postprocess(self, target):
         """ Save objects in db.
 
@@ -328,10 +380,47 @@ class Mixer(BaseMixer):
                 LOGGER.warning("'commit' set true but session not initialized.")
             else:
                 session.add(target)
-                session.commit()
+                if not isinstance(session, AsyncSession):
+                    session.commit()
 
         return target
 
+    def postprocess_many(self, targets):
+        """ Save a batch in one commit.
+
+        :return list: targets
+
+        """
+        if self.params.get('commit'):
+            session = self.params.get('session')
+            if not session:
+                LOGGER.warning("'commit' set true but session not initialized.")
+            else:
+                session.add_all(targets)
+                if not isinstance(session, AsyncSession):
+                    session.commit()
+
+        return targets
+
+    async def apostprocess_many(self, targets):
+        """ Save a batch with an async session.
+
+        Commits to the same session are serialized.
+
+        :return list: targets
+
+        """
+        session = self.params.get('session')
+        if not self.params.get('commit') or not isinstance(session, AsyncSession):
+            return await super(Mixer, self).apostprocess_many(targets)
+
+        lock = session.sync_session.info.setdefault('mixer.lock', asyncio.Lock())
+        async with lock:
+            session.add_all(targets)
+            await session.commit()
+
+        return targets
+
 
 # Default mixer
 mixer = Mixer()
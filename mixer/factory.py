@@ -42,6 +42,9 @@ class GenFactoryMeta(type):
         params['fakers'] = fakers
         params['types'] = types
 
+        # Classes resolved by GenFactory.resolve
+        params['resolved'] = dict()
+
         return super(GenFactoryMeta, mcs).__new__(mcs, name, bases, params)
 
     @staticmethod
@@ -60,17 +63,17 @@ class GenFactory(_.with_metaclass(GenFactoryMeta)):
 
     generators = {
         bool: faker.pybool,
-        float: faker.pyfloat,
+        float: faker.random_float,
         int: faker.random_int,
-        str: faker.pystr,
-        bytes: faker.pybytes,
+        str: faker.random_string,
+        bytes: faker.random_bytes,
         list: faker.pylist,
         set: faker.pyset,
         tuple: faker.pytuple,
         dict: faker.pydict,
-        datetime.date: faker.date,
-        datetime.datetime: faker.date_time,
-        datetime.time: faker.time,
+        datetime.date: faker.random_date,
+        datetime.datetime: faker.random_datetime,
+        datetime.time: faker.random_time,
         decimal.Decimal: faker.small_decimal,
         typing.Any: lambda: faker.pytuple(1)[0],
         t.BigInteger: faker.big_integer,
@@ -142,18 +145,55 @@ class GenFactory(_.with_metaclass(GenFactoryMeta)):
         :return type: A simple type for generation
 
         """
-        if fcls in cls.types:
-            return cls.types[fcls]
+        return cls.resolve(fcls)[0]
+
+    @classmethod
+    def resolve(cls, fcls):
+        """ Find a simple type and a generator for the class.
+
+        The class's MRO is walked once, results are cached by the class.
+        Call :meth:`GenFactory.clear_cache` after changes of the factory's
+        generators or types.
+
+        :return tuple: (simple type or None, generator or None)
+
+        """
+        try:
+            return cls.resolved[fcls]
+        except KeyError:
+            pass
+        except TypeError:
+            return cls.__resolve(fcls)
+
+        resolved = cls.resolved[fcls] = cls.__resolve(fcls)
+        return resolved
 
-        if fcls in cls.generators:
-            return fcls
+    @classmethod
+    def clear_cache(cls):
+        """ Drop resolved classes. """
+        cls.resolved.clear()
+
+    @classmethod
+    def __resolve(cls, fcls):
+        mro = inspect.getmro(fcls) if inspect.isclass(fcls) else (fcls,)
+
+        simple = None
+        for base in mro:
+            if base in cls.types:
+                simple = cls.types[base]
+                break
 
-        if inspect.isclass(fcls):
-            for stype in cls.types:
-                if issubclass(fcls, stype):
-                    return cls.types[stype]
+            if base in cls.generators:
+                simple = base
+                break
 
-        return None
+        func = cls.generators.get(fcls) or cls.generators.get(simple)
+        for base in mro[1:]:
+            if func:
+                break
+            func = cls.generators.get(base)
+
+        return simple, func
 
     @staticmethod
     def name_to_simple(fname):
@@ -172,11 +212,7 @@ class GenFactory(_.with_metaclass(GenFactoryMeta)):
         :return function:
 
         """
-        simple = cls.cls_to_simple(fcls)
-        func = cls.generators.get(fcls) or cls.generators.get(simple)
-
-        if not func and fcls and fcls.__bases__:
-            func = cls.generators.get(fcls.__bases__[0])
+        simple, func = cls.resolve(fcls)
 
         if fname and fake and (fname, simple) in cls.fakers:
             fname = cls.name_to_simple(fname)
@@ -14,8 +14,15 @@ from __future__ import absolute_import, unicode_literals
 import warnings
 from types import GeneratorType
 
+import datetime
+import decimal
+import itertools
 import logging
+import random
+import time
 import traceback
+import uuid
+import zlib
 from collections import defaultdict
 from contextlib import contextmanager
 from copy import deepcopy
@@ -24,22 +31,89 @@ from types import FunctionType, MethodType, BuiltinFunctionType
 
 from . import mix_types as t, _compat as _
 from .factory import GenFactory
-from ._faker import faker
+from ._faker import faker, LazyFormatter
+from .markov import MarkovText
+from .pool import Pool
+from .rng import Streams, derive_seed
+from .unique import ExactTracker, Exhausted, make_unique_fabric, with_suffix
 
 
 SKIP_VALUE = object()
 
+BATCH_SIZE = 100
+
+# Parallel generation is split to chunks with own seeds and unique values
+PARALLEL_CHUNKS = 16
+
+# Types of unique values which are split between parallel chunks
+SHARD_TYPES = _.string_types + _.integer_types + (
+    bytes, float, decimal.Decimal, datetime.date, datetime.time,
+    datetime.timedelta, uuid.UUID, tuple, frozenset)
+
 LOGLEVEL = logging.WARN
 LOGGER = logging.getLogger('mixer')
 if not LOGGER.handlers and not LOGGER.root.handlers:
     LOGGER.addHandler(logging.StreamHandler())
 
 
+class TypeMixerCache(object):
+
+    """ LRU cache of typemixers.
+
+    :param maxsize: Max number of typemixers (unbounded by default)
+
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.data = _.OrderedDict()
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key):
+        """ Get a typemixer and mark it as recently used.
+
+        :return TypeMixer: A typemixer or None
+
+        """
+        type_mixer = self.data.get(key)
+        if type_mixer is not None and self.maxsize:
+            self.data.move_to_end(key)
+        return type_mixer
+
+    def set(self, key, type_mixer):
+        """ Cache a typemixer and evict least recently used ones. """
+        self.data[key] = type_mixer
+        self.resize(self.maxsize)
+
+    def resize(self, maxsize=None):
+        """ Bound the cache (unbounded with `None`), evict extra typemixers. """
+        self.maxsize = maxsize
+        while maxsize and len(self.data) > maxsize:
+            self.data.popitem(last=False)
+
+    def items(self):
+        """ Get a list of (key, typemixer). """
+        return list(self.data.items())
+
+    def clear(self):
+        """ Drop all typemixers. """
+        self.data.clear()
+
+
 class TypeMixerMeta(type):
 
-    """ Cache typemixers by scheme. """
+    """ Cache typemixers by scheme.
+
+    Typemixers of a mixer are cached by the mixer (see
+    :attr:`Mixer.type_mixers`), so they are freed with it. Typemixers
+    without a mixer are cached by the class, the cache could be bound by
+    :meth:`TypeMixerMeta.set_cache_size`.
 
-    mixers = dict()
+    """
+
+    mixers = TypeMixerCache()
 
     def __call__(cls, cls_type, mixer=None, factory=None, fake=True):
         backup = cls_type
@@ -49,12 +123,37 @@ class TypeMixerMeta(type):
         except (AttributeError, AssertionError, LookupError):
             raise ValueError('Invalid scheme: %s' % backup)
 
+        cache = cls.get_cache(mixer)
         key = (mixer, cls_type, fake, factory)
-        if key not in cls.mixers:
-            cls.mixers[key] = super(TypeMixerMeta, cls).__call__(
+        type_mixer = cache.get(key)
+        if type_mixer is None:
+            type_mixer = super(TypeMixerMeta, cls).__call__(
                 cls_type, mixer=mixer, factory=factory, fake=fake)
+            cache.set(key, type_mixer)
+
+        return type_mixer
+
+    def set_cache_size(cls, maxsize=None):
+        """ Bound the cache of typemixers without a mixer (LRU).
 
-        return cls.mixers[key]
+        ::
+
+            TypeMixer.set_cache_size(100)
+
+        """
+        cls.mixers.resize(maxsize)
+
+    def get_cache(cls, mixer=None):
+        """ Get a cache of the mixer's typemixers.
+
+        :return TypeMixerCache:
+
+        """
+        cache = getattr(mixer, 'type_mixers', None)
+        if cache is None:
+            return cls.mixers
+
+        return cache
 
     @staticmethod
     def __load_cls(cls_type):
@@ -81,8 +180,13 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         self.middlewares = []
         self.__factory = factory or self.factory
         self.__fake = fake
-        self.__gen_values = defaultdict(set)
+        self.__gen_values = defaultdict(self.__make_tracker)
+        self.__unique_fabrics = dict()
+        self.__pools = []
+        self.__suffixes = defaultdict(partial(itertools.count, 1))
         self.__fabrics = dict()
+        self.__registered = dict()
+        self.__plans = dict()
         self.__mixer = mixer
         self.__scheme = cls
         self.__fields = _.OrderedDict(self.__load_fields())
@@ -97,24 +201,132 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         :return value: a generated value
 
         """
-        defaults = deepcopy(self.__fields)
+        stats = self.get_stats()
+        target, postprocess_values = self.__blend_target(self.get_plan(values), values, stats)
 
-        # Prepare relations
-        for key, params in values.items():
-            if '__' in key:
-                name, value = key.split('__', 1)
-                if name not in defaults:
-                    defaults[name] = t.Field(None, name)
-                defaults[name].params.update({value: params})
+        started = stats and time.perf_counter()
+        target = self.postprocess(target, postprocess_values)
+        if stats:
+            stats.add(self.__scheme, None, 'postprocess', time.perf_counter() - started)
+
+        LOGGER.info('Blended: %s [%s]', target, self.__scheme) # noqa
+        return target
+
+    def blend_many(self, count, values):
+        """ Generate a batch of objects.
+
+        The blend plan is resolved and the objects are postprocessed once per
+        batch. Generators and callables in `values` are called for each object.
+
+        :param count: Size of the batch
+        :param values: A dict of predefined fields
+        :return list: Generated objects
+
+        """
+        stats = self.get_stats()
+        plan = self.get_plan(values)
+        targets = [self.__blend_target(plan, values, stats) for _ in range(count)]
+
+        started = stats and time.perf_counter()
+        targets = self.postprocess_many(targets)
+        if stats:
+            stats.add(self.__scheme, None, 'postprocess', time.perf_counter() - started)
+
+        LOGGER.info('Blended: %s objects [%s]', len(targets), self.__scheme) # noqa
+        return targets
+
+    async def ablend_many(self, count, values):
+        """ Generate a batch of objects and save them asynchronously.
+
+        See :meth:`TypeMixer.blend_many`.
+
+        :return list: Generated objects
+
+        """
+        stats = self.get_stats()
+        plan = self.get_plan(values)
+        targets = [self.__blend_target(plan, values, stats) for _ in range(count)]
+
+        started = stats and time.perf_counter()
+        targets = await self.apostprocess_many(targets)
+        if stats:
+            stats.add(self.__scheme, None, 'postprocess', time.perf_counter() - started)
+
+        LOGGER.info('Blended: %s objects [%s]', len(targets), self.__scheme) # noqa
+        return targets
+
+    def blend_columns(self, count, values, vectors=None):
+        """ Generate values for `count` objects by columns.
+
+        Objects are not created, so relations are skipped. Fields which
+        fabrics are found in `vectors` are generated at once.
+
+        :param count: Number of rows
+        :param values: A dict of predefined fields
+        :param vectors: A dict of fabrics to functions which get a number
+                        of rows (and keyword arguments of the fabrics)
+                        and return a column of values
+        :return dict: Column's name -> list of values (or a result of vectors)
+
+        """
+        relations = [name for name in values if '__' in name]
+        if relations:
+            raise ValueError('Relations are not supported by columns: %s' % relations)
+
+        vectors = vectors or {}
+        columns = _.OrderedDict()
+        for step in self.get_plan(values):
+            fabric_step = step
+            while isinstance(fabric_step, (_TimedStep, _SeededStep)):
+                fabric_step = fabric_step.step
+
+            if isinstance(fabric_step, _FabricStep):
+
+                # Related objects are skipped, they would be created
+                if fabric_step.relation:
+                    continue
+
+                # Fabrics with keyword arguments are vectorized with them
+                fabric, kwargs = fabric_step.fabric, {}
+                if isinstance(fabric, partial) and not fabric.args and fabric.func in vectors:
+                    fabric, kwargs = fabric.func, fabric.keywords
+
+                if not fabric_step.unique and fabric in vectors:
+                    vector = partial(vectors[fabric], count, **kwargs)
+                    if isinstance(step, _SeededStep):
+                        vector = partial(step.call, vector)
+                    columns[fabric_step.name] = vector()
+                    continue
+
+            rows = [step(values) for _ in range(count)]
+            if not rows or all(value is SKIP_VALUE for _, value in rows):
                 continue
-            defaults[key] = params
 
-        values = dict(
-            value.gen_value(self, name, value)
-            if isinstance(value, t.ServiceValue)
-            else self.get_value(name, value)
-            for name, value in defaults.items()
-        )
+            columns[rows[0][0]] = [
+                None if value is SKIP_VALUE else
+                value.value if isinstance(value, t._Deffered) else value
+                for _, value in rows]
+
+        # Parse MIX values
+        mixed = [
+            name for name, column in columns.items()
+            if isinstance(column, list) and isinstance(column[0], t.Mix)]
+        for num in range(count if mixed else 0):
+            row = dict((name, column[num]) for name, column in columns.items())
+            for name in mixed:
+                columns[name][num] = columns[name][num] & row
+
+        return columns
+
+    def __blend_target(self, plan, values, stats=None):
+        """ Generate a target by the plan and run middlewares.
+
+        :param stats: Record time of creation and middlewares to the stats
+
+        :return : (target, postprocess_values)
+
+        """
+        values = dict(step(values) for step in plan)
 
         # Parse MIX and SKIP values
         candidates = list(
@@ -131,16 +343,136 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             else:
                 values.append((name, value))
 
-        target = self.populate_target(values)
+        if stats is None:
+            target = self.populate_target(values)
+
+            # Run registered middlewares
+            for middleware in self.middlewares:
+                target = middleware(target)
 
-        # Run registered middlewares
+            return target, postprocess_values
+
+        started = time.perf_counter()
+        target = self.populate_target(values)
+        populated = time.perf_counter()
         for middleware in self.middlewares:
             target = middleware(target)
 
-        target = self.postprocess(target, postprocess_values)
+        stats.add(self.__scheme, None, 'populate', populated - started)
+        if self.middlewares:
+            stats.add(self.__scheme, None, 'middleware', time.perf_counter() - populated)
 
-        LOGGER.info('Blended: %s [%s]', target, self.__scheme) # noqa
-        return target
+        return target, postprocess_values
+
+    def get_plan(self, values):
+        """ Get a compiled blend plan for the predefined values.
+
+        Plans are cached by the names of predefined values. With stats
+        (see :mod:`mixer.stats`) steps of the plan record their time.
+
+        :return list: See :meth:`TypeMixer.compile_plan`
+
+        """
+        keys = frozenset(values)
+        plan = self.__plans.get(keys)
+        if plan is None:
+            plan = self.compile_plan(list(values))
+            stats = self.get_stats()
+            if stats:
+                plan = [_TimedStep(step, stats, self.__scheme) for step in plan]
+            self.__plans[keys] = plan
+        return plan
+
+    def get_stats(self):
+        """ Get stats of the mixer (see :mod:`mixer.stats`).
+
+        :return Stats: Stats or None
+
+        """
+        return self.__mixer.params.get('stats') if self.__mixer else None
+
+    def compile_plan(self, keys):
+        """ Compile generation steps for the names of predefined values.
+
+        Steps of extra values and relations are ordered as the keys, so
+        generation doesn't depend on hashes of the names.
+
+        :param keys: A list of names of predefined values (relations included)
+
+        :return list: A list of functions which get predefined values
+                      and return (name, value)
+
+        """
+        relations = _.OrderedDict()
+        for key in keys:
+            if '__' in key:
+                name, param = key.split('__', 1)
+                relations.setdefault(name, []).append((key, param))
+
+        def value_step(name):
+            def step(values):
+                value = values[name]
+                if isinstance(value, t.ServiceValue):
+                    return value.gen_value(self, name, value)
+                return self.get_value(name, value)
+            return step
+
+        def relation_step(scheme, name, params):
+            def step(values):
+                field = t.Field(scheme, name)
+                field.params.update((param, values[key]) for key, param in params)
+                return self.gen_field(field)
+            return step
+
+        plan = []
+        for name, field in self.__fields.items():
+            if name in keys:
+                plan.append((name, value_step(name)))
+            elif name in relations:
+                plan.append((name, relation_step(field.scheme, name, relations[name])))
+            else:
+                plan.append((name, self.compile_field(field)))
+
+        for key in keys:
+            if '__' not in key and key not in self.__fields:
+                plan.append((key, value_step(key)))
+
+        for name, params in relations.items():
+            if name not in self.__fields and name not in keys:
+                plan.append((name, relation_step(None, name, params)))
+
+        # Fields draw values from own random streams (see :mod:`mixer.rng`)
+        streams = self.__mixer and self.__mixer.get_streams()
+        if streams:
+            return [_SeededStep(step, streams, (self.__scheme, name)) for name, step in plan]
+
+        return [step for _, step in plan]
+
+    def compile_field(self, field):
+        """ Compile generation of a value for the field.
+
+        Fabric and field's flags are resolved once.
+
+        :param field: Instance of :class:`Field`
+
+        :return function: A function which gets predefined values
+                          and returns (name, value)
+
+        """
+        if self.get_default(field) is not SKIP_VALUE:
+            return lambda values: self.gen_field(field)
+
+        if not self.is_required(field):
+            skip = field.name, SKIP_VALUE
+            return lambda values: skip
+
+        return _FabricStep(
+            field.name, self.get_fabric(field, field.name), self.is_unique(field),
+            self.is_relation(field), self.__make_value)
+
+    def reset_plans(self):
+        """ Drop compiled blend plans. """
+        self.__plans.clear()
 
     def postprocess(self, target, postprocess_values):
         """ Run the code after a generation. """
@@ -152,6 +484,40 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
 
         return target
 
+    def postprocess_many(self, targets):
+        """ Run the code after a generation of a batch.
+
+        :param targets: A list of (target, postprocess_values)
+        :return list: Targets
+
+        """
+        result = [target for target, _ in targets]
+        if self.__mixer:
+            result = self.__mixer.postprocess_many(result)
+
+        for target, (_, postprocess_values) in zip(result, targets):
+            for name, deffered in postprocess_values:
+                setattr(target, name, deffered.value)
+
+        return result
+
+    async def apostprocess_many(self, targets):
+        """ Run the code after a generation of a batch asynchronously.
+
+        :param targets: A list of (target, postprocess_values)
+        :return list: Targets
+
+        """
+        result = [target for target, _ in targets]
+        if self.__mixer:
+            result = await self.__mixer.apostprocess_many(result)
+
+        for target, (_, postprocess_values) in zip(result, targets):
+            for name, deffered in postprocess_values:
+                setattr(target, name, deffered.value)
+
+        return result
+
     def populate_target(self, values):
         """ Populate a target by values. """
         target = self.__scheme()
@@ -168,7 +534,7 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         if isinstance(value, GeneratorType):
             return self.get_value(name, next(value))
 
-        if isinstance(value, (FunctionType, MethodType, BuiltinFunctionType)):
+        if isinstance(value, (FunctionType, MethodType, BuiltinFunctionType, LazyFormatter)):
             return self.get_value(name, value())
 
         return name, value
@@ -236,27 +602,61 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             field = t.Field(getattr(self.__scheme, field_name, None), field_name)
 
         fab = self.get_fabric(field, field_name, fake=fake)
+        return self.__make_value(field_name, fab, unique)
+
+    def __make_value(self, field_name, fab, unique=False):
+        """ Call the fabric and check the value's uniqueness.
+
+        Unique values are drawn from unique fabrics when they are known (see
+        :func:`mixer.unique.make_unique_fabric`). Repeated strings get
+        a counter suffix.
+
+        """
+        max_length = getattr(fab, 'max_length', None)
+        if unique:
+            fab = self.__get_unique_fabric(field_name, fab)
 
         try:
             value = fab()
         except ValueError:
             value = None
+        except Exhausted as exc:
+            raise RuntimeError("Cannot generate a unique value for %s: %s" % (field_name, exc))
         except Exception as exc:
             LOGGER.exception(exc)
             raise ValueError("Generation for %s (%s) has been stopped. Exception: %s" % (
                 field_name, self.__scheme.__name__, exc))
 
         if unique and value is not SKIP_VALUE:
+            # Sharded unique fabrics don't draw values of other shards
+            shard = self.__mixer and self.__mixer.params.get('shard')
+            if hasattr(fab, 'shard'):
+                shard = None
+            retries = 100 * shard[1] if shard else 100
             counter = 0
-            try:
-                while value in self.__gen_values[field_name]:
+            tracker = self.__gen_values[field_name]
+            base = value
+            while value in tracker or shard and not in_shard(value, shard[0], shard[1]):
+                counter += 1
+                if counter > retries:
+                    raise RuntimeError("Cannot generate a unique value for %s" % field_name)
+
+                if isinstance(base, _.string_types):
+                    value = with_suffix(base, next(self.__suffixes[field_name]), max_length)
+                    if max_length is None or len(value) <= max_length:
+                        continue
+
+
+                try:
                     value = fab()
-                    counter += 1
-                    if counter > 100:
-                        raise RuntimeError("Cannot generate a unique value for %s" % field_name)
-                self.__gen_values[field_name].add(value)
-            except TypeError:
-                pass
+                except Exhausted as exc:
+                    raise RuntimeError(
+                        "Cannot generate a unique value for %s: %s" % (field_name, exc))
+            tracker.add(value)
+
+            stats = counter and self.get_stats()
+            if stats:
+                stats.add(self.__scheme, field_name, 'unique_retry', count=counter)
 
         return self.get_value(field_name, value)
 
@@ -277,12 +677,50 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             return self.make_fabric(field.scheme, field_name, fake, kwargs=field.params)
 
         key = (field.scheme, field_name, fake)
+        stats = self.get_stats()
 
         if key not in self.__fabrics:
-            self.__fabrics[key] = self.make_fabric(field.scheme, field_name, fake)
+            started = stats and time.perf_counter()
+            fab = self.make_fabric(field.scheme, field_name, fake)
+            self.__fabrics[key] = self.__make_pool(field.scheme, field_name, fab)
+            if stats:
+                stats.add(
+                    self.__scheme, field_name, 'fabric_miss', time.perf_counter() - started)
+
+        elif stats:
+            stats.add(self.__scheme, field_name, 'fabric_hit')
 
         return self.__fabrics[key]
 
+    def __make_pool(self, scheme, field_name, fab):
+        """ Wrap the fabric to a pool when it's set by `pools` param.
+
+        See :mod:`mixer.pool`.
+
+        """
+        # Pools of a factory (see :class:`mixer.vector.VectorFactory`)
+        if isinstance(fab, Pool):
+            self.__pools.append(fab)
+            return fab
+
+        pools = self.__mixer and self.__mixer.params.get('pools')
+        if not pools or not fab:
+            return fab
+
+        stype = self.__factory.cls_to_simple(scheme if isinstance(scheme, type) else type(scheme))
+        pool_cls = pools.get((field_name, stype)) or pools.get((field_name, None))
+        if pool_cls is None:
+            return fab
+
+        pool = pool_cls(fab)
+        self.__pools.append(pool)
+        return pool
+
+    def reset_pools(self):
+        """ Drop pre-generated values of pooled fabrics. """
+        for pool in self.__pools:
+            pool.clear()
+
     def make_fabric(self, scheme, field_name=None, fake=None, kwargs=None): # noqa
         """ Make a fabric for scheme.
 
@@ -301,10 +739,44 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
                                       factory=self.__factory).blend, **kwargs)
 
         if kwargs:
+
+            if isinstance(fab, Pool):
+                return fab.bind(**kwargs)
+
             return partial(fab, **kwargs)
 
         return fab
 
+    @staticmethod
+    def make_string_fabric(fab, max_length=None):
+        """ Make a fabric of strings which aren't longer than `max_length`.
+
+        Random strings and texts (Markov texts included) are generated with
+        the length, other fabrics' values are truncated. The fabric keeps
+        the length in `max_length` attribute (suffixes of unique values are
+        fitted to it).
+
+        :return function:
+
+        """
+        if not max_length:
+            return fab
+
+        if fab == faker.random_string or fab is faker.pystr:
+            fabric = partial(faker.random_string, min(max_length, 20))
+
+        elif fab is faker.text and max_length >= 5:
+            fabric = partial(faker.text, max_nb_chars=min(max_length, 200))
+
+        elif isinstance(fab, MarkovText):
+            fabric = fab.bind(max_nb_chars=max_length)
+
+        else:
+            fabric = lambda: fab()[:max_length] # noqa
+
+        fabric.max_length = max_length
+        return fabric
+
     def register(self, field_name, func, fake=None):
         """ Register function as fabric for the field.
 
@@ -336,10 +808,98 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
 
         key = (field.scheme, field_name, fake)
         self.__fabrics[key] = func
+        self.__registered[field_name, fake] = func
+        self.__plans.clear()
 
-        if not isinstance(func, (FunctionType, MethodType)):
+        if not isinstance(func, (FunctionType, MethodType, LazyFormatter)):
             self.__fabrics[key] = lambda: func
 
+    def dump_state(self):
+        """ Get the state of the typemixer which isn't defined by a scheme.
+
+        The state is used to copy the typemixer to worker processes.
+
+        :return dict: Registered fabrics, middlewares and generated unique values
+
+        """
+        return dict(
+            fabrics=dict(self.__registered),
+            middlewares=list(self.middlewares),
+            unique=dict(self.__gen_values),
+        )
+
+    def reset_unique(self, trackers=None):
+        """ Forget generated unique values.
+
+        :param trackers: A dict of field's name -> tracker to use instead
+                         (empty trackers by default)
+        :return dict: Previous trackers
+
+        """
+        previous = dict(self.__gen_values)
+        self.__gen_values = defaultdict(self.__make_tracker, trackers or {})
+        self.reset_unique_fabrics()
+        return previous
+
+    def reset_unique_fabrics(self):
+        """ Restart unique fabrics and counters of the fields.
+
+        Values which are already generated are still checked by trackers.
+
+        """
+        self.__unique_fabrics.clear()
+        self.__suffixes.clear()
+
+    def __get_unique_fabric(self, field_name, fab):
+        """ Get a unique fabric for the fabric of the field (cached).
+
+        Chunks of a parallel generation get disjoint shards of the same
+        unique fabric (see :meth:`Mixer.cycle`).
+
+        """
+        cached = self.__unique_fabrics.get(field_name)
+        if cached is None or cached[0] is not fab:
+
+            # Pooled values are repeated
+            unique_fab = fab.fabric if isinstance(fab, Pool) else fab
+            shard = self.__mixer and self.__mixer.params.get('shard')
+            if shard:
+                previous = faker.swap_random(random.Random(
+                    derive_seed(shard[2], (self.__scheme, field_name))))
+                try:
+                    unique_fab = make_unique_fabric(unique_fab) or unique_fab
+                finally:
+                    faker.swap_random(previous)
+
+                if hasattr(unique_fab, 'shard'):
+                    unique_fab.shard(shard[0], shard[1])
+
+            else:
+                unique_fab = make_unique_fabric(unique_fab) or unique_fab
+
+            cached = self.__unique_fabrics[field_name] = fab, unique_fab
+        return cached[1]
+
+    def __make_tracker(self):
+        """ Create a tracker of unique values (see :mod:`mixer.unique`). """
+        tracker_cls = self.__mixer and self.__mixer.params.get('unique_tracker')
+        return (tracker_cls or ExactTracker)()
+
+    def load_state(self, state):
+        """ Load a state from :meth:`TypeMixer.dump_state`.
+
+        Unique values are merged with the values generated by the typemixer.
+
+        """
+        for (field_name, fake), func in state.get('fabrics', {}).items():
+            self.register(field_name, func, fake=fake)
+
+        if 'middlewares' in state:
+            self.middlewares = list(state['middlewares'])
+
+        for field_name, values in state.get('unique', {}).items():
+            self.__gen_values[field_name].update(values)
+
     @staticmethod
     def is_unique(field):
         """ Return True is field's value should be a unique.
@@ -358,6 +918,15 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         """
         return True
 
+    def is_relation(self, field):
+        """ Return True if field's value is an object of other scheme.
+
+        :return bool:
+
+        """
+        return isinstance(field.scheme, type) and \
+            not self.__factory.get_fabric(field.scheme, field.name)
+
     @staticmethod
     def get_default(field):
         """ Return a default value for the field if it exists.
@@ -389,6 +958,115 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             yield fname, t.Field(prop, fname)
 
 
+class _TimedStep(object):
+
+    """ A step of a plan which records its time (see :mod:`mixer.stats`). """
+
+    __slots__ = 'step', 'stats', 'scheme'
+
+    def __init__(self, step, stats, scheme):
+        self.step = step
+        self.stats = stats
+        self.scheme = scheme
+
+    def __call__(self, values):
+        started = time.perf_counter()
+        name, value = self.step(values)
+        self.stats.add(self.scheme, name, 'gen_value', time.perf_counter() - started)
+        return name, value
+
+
+class _SeededStep(object):
+
+    """ A step of a plan which draws values from own random stream.
+
+    See :mod:`mixer.rng`.
+
+    """
+
+    __slots__ = 'step', 'streams', 'key'
+
+    def __init__(self, step, streams, key):
+        self.step = step
+        self.streams = streams
+        self.key = key
+
+    def __call__(self, values):
+        return self.call(self.step, values)
+
+    def call(self, func, *args):
+        """ Call the function with the step's random stream. """
+        previous = faker.swap_random(self.streams.get(self.key))
+        try:
+            return func(*args)
+        finally:
+            faker.swap_random(previous)
+
+
+class _FabricStep(object):
+
+    """ A compiled step which generates a field's value by a fabric. """
+
+    __slots__ = 'name', 'fabric', 'unique', 'relation', 'make_value'
+
+    def __init__(self, name, fabric, unique, relation, make_value):
+        self.name = name
+        self.fabric = fabric
+        self.unique = unique
+        self.relation = relation
+        self.make_value = make_value
+
+    def __call__(self, values):
+        return self.make_value(self.name, self.fabric, self.unique)
+
+
+def in_shard(value, index, shards):
+    """ Check that a unique value belongs to the shard.
+
+    Shards split values spaces of parallel workers, so the workers
+    never generate the same unique values. Values are split by their
+    reprs; other objects (instances of schemes, etc) are never equal
+    between processes and belong to any shard. Unique fabrics with
+    known spaces of values are split by strides instead (see
+    :meth:`mixer.unique.Permutation.shard`).
+
+    :return bool:
+
+    """
+    if not isinstance(value, SHARD_TYPES):
+        return True
+
+    return zlib.crc32(repr(value).encode('utf-8')) % shards == index
+
+
+class _Rows(list):
+
+    """ Predefined values for each row of a parallel chunk. """
+
+    pass
+
+
+# The mixer of a worker process (see :meth:`Mixer.init_worker`)
+_WORKER = dict()
+
+
+def _init_worker(mixer):
+    """ Prepare a worker process of a parallel generation. """
+    mixer.init_worker()
+    _WORKER['mixer'] = mixer
+
+
+def _blend_chunk(scheme, count, seed, shard, values):
+    """ Generate a chunk of objects in a worker process.
+
+    :return tuple: Objects, were objects saved, generated unique values
+
+    """
+    mixer = _WORKER['mixer']
+    targets = mixer._blend_chunk(scheme, count, seed, shard, values) # noqa
+    return targets, bool(mixer.params.get('commit')), mixer._dump_unique() # noqa
+
+
 class ProxyMixer:
 
     """ A Mixer's proxy. Using for generate more than one object.
@@ -399,27 +1077,23 @@ class ProxyMixer:
 
     """
 
-    def __init__(self, mixer, count=5, guards=None):
+    def __init__(self, mixer, count=5, guards=None, **params):
         self.count = count
         self.mixer = mixer
         self.guards = guards
+        self.params = params
 
     def blend(self, scheme, **values):
-        """ Call :meth:`Mixer.blend` a few times. And stack results to list.
+        """ Generate objects by batches (see :meth:`Mixer.blend_many`).
 
         :returns: A list of generated objects.
 
         """
-        result = []
-
         if self.guards:
             return self.mixer._guard(scheme, self.guards, **values) # noqa
 
-        for _ in range(self.count):
-            result.append(
-                self.mixer.blend(scheme, **values)
-            )
-        return result
+        batches = self.mixer._blend_batches(scheme, self.count, values, **self.params) # noqa
+        return [target for batch in batches for target in batch]
 
     def __getattr__(self, name):
         raise AttributeError('Use "cycle" only for "blend"')
@@ -470,11 +1144,18 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         :param silence: (False) Don't raise any errors if creation was falsed
         :param factory: (:class:`~mixer.main.GenFactory`) A class for
                           generation values for types
+        :param locale: Set the default locale of the faker (threads which
+                       haven't own locale use it)
 
         """
         self.params = params
         self.faker = faker
-        self.__init_params__(fake=fake, loglevel=loglevel, silence=silence, locale=locale)
+        self.type_mixers = TypeMixerCache(params.get('cache_size'))
+        self.__streams = None
+        if locale:
+            faker.set_default_locale(locale)
+            self.params['locale'] = faker.locale
+        self.__init_params__(fake=fake, loglevel=loglevel, silence=silence)
         self.__factory = factory or self.type_mixer_cls.factory
 
     def __getattr__(self, name):
@@ -541,6 +1222,10 @@ class Mixer(_.with_metaclass(_MetaMixer)):
             self.params['locale'] = faker.locale
         LOGGER.setLevel(self.params.get('loglevel'))
 
+        # Compiled plans depend on the mixer's params
+        for _, type_mixer in self.type_mixers.items():
+            type_mixer.reset_plans()
+
     def __repr__(self):
         return "<Mixer [{0}]>".format(
             'fake' if self.params.get('fake') else 'rand')
@@ -569,11 +1254,383 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         except Exception as e:
             if self.params.get('silence'):
                 return None
-            if e.args:
-                e.args = ('Mixer (%s): %s' % (scheme, e.args[0]),) + e.args[1:]
-            LOGGER.error(traceback.format_exc())
+            self.__log_exception(scheme, e)
             raise
 
+    def blend_many(self, scheme, count=5, **values):
+        """Generate a few instances of `scheme` by batches.
+
+        The scheme is resolved once and each batch is postprocessed at once
+        (see :meth:`Mixer.postprocess_many`). Size of the batches is set by
+        `batch_size` param. With `workers` param the objects are generated
+        in a process pool (see :meth:`Mixer.cycle`).
+
+        When a batch fails and `silence` param is set, the batch's objects
+        are generated one by one (`None` for failed objects).
+
+        :param scheme: Scheme class for generation or string with class path.
+        :param count: Number of instances
+        :param values: Keyword params with predefined values
+        :return value: A list of generated instances
+
+        ::
+
+            mixer = Mixer(batch_size=500)
+
+            users = mixer.blend_many(User, 1000, name=mixer.sequence('user{0}'))
+
+        """
+        return list(self.stream(scheme, count, **values))
+
+    async def ablend(self, scheme, **values):
+        """Generate an instance of `scheme` and save it asynchronously.
+
+        See :meth:`Mixer.ablend_many`.
+
+        :return value: A generated instance
+
+        """
+        targets = await self.ablend_many(scheme, 1, **values)
+        return targets[0] if targets else None
+
+    async def ablend_many(self, scheme, count=5, **values):
+        """Generate a few instances of `scheme` and save them asynchronously.
+
+        Objects are generated in the current thread by batches (see
+        :meth:`Mixer.blend_many`) and saved with
+        :meth:`Mixer.apostprocess_many`. Batches are generated while the
+        previous ones are being saved, up to `concurrency` param batches
+        at once.
+
+        :param scheme: Scheme class for generation or string with class path.
+        :param count: Number of instances
+        :param values: Keyword params with predefined values
+        :return value: A list of generated instances
+
+        ::
+
+            mixer = Mixer(session=async_session, concurrency=4)
+
+            user = await mixer.ablend(User)
+            users = await mixer.ablend_many(User, 1000)
+
+        """
+        type_mixer = self.get_typemixer(scheme)
+        batch_size = self.params.get('batch_size') or BATCH_SIZE
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.params.get('concurrency') or 1)
+
+        async def blend(size):
+            async with semaphore:
+                return await type_mixer.ablend_many(size, values)
+
+        try:
+            batches = await asyncio.gather(*(
+                blend(min(batch_size, count - start))
+                for start in range(0, count, batch_size)))
+        except Exception as e:
+            if self.params.get('silence'):
+                return []
+            self.__log_exception(scheme, e)
+            raise
+
+        return [target for batch in batches for target in batch]
+
+    def blend_columns(self, scheme, count=5, **values):
+        """Generate values for a few instances of `scheme` by columns.
+
+        Instances are not created and relations are skipped. Numeric,
+        boolean, decimal and temporal values are generated with NumPy at once
+        for a column (see :mod:`mixer.vector`). NumPy generator of a column is
+        seeded from the faker's random state (from the field's stream with
+        `seed` param).
+
+        :param scheme: Scheme class for generation or string with class path.
+        :param count: Number of rows
+        :param values: Keyword params with predefined values
+        :return dict: Column's name -> NumPy array (or list for object types)
+
+        ::
+
+            mixer = Mixer()
+
+            columns = mixer.blend_columns(SomeScheme, 10 ** 6)
+            print columns['score'].mean()
+
+        """
+        try:
+            from .vector import VECTORS, with_rng
+        except ImportError:
+            raise ImportError('Columns require NumPy: pip install mixer[numpy]')
+
+        vectors = dict((fab, partial(with_rng, vector)) for fab, vector in VECTORS.items())
+        type_mixer = self.get_typemixer(scheme)
+        try:
+            return type_mixer.blend_columns(count, values, vectors)
+        except Exception as e:
+            if self.params.get('silence'):
+                return None
+            self.__log_exception(scheme, e)
+            raise
+
+    def stream(self, scheme, count=None, **values):
+        """Generate instances of `scheme` lazily.
+
+        Objects are generated and postprocessed by batches when the stream
+        is consumed (see :meth:`Mixer.batches`).
+
+        :param scheme: Scheme class for generation or string with class path.
+        :param count: Number of instances (infinite by default)
+        :param values: Keyword params with predefined values
+        :return iterator:
+
+        ::
+
+            mixer = Mixer()
+
+            for user in mixer.stream(User, 10 ** 7, name=mixer.sequence('user{0}')):
+                writer.writerow([user.name])
+
+        """
+        return (target for batch in self.batches(scheme, count, **values) for target in batch)
+
+    def batches(self, scheme, count=None, **values):
+        """Generate lists of instances of `scheme` lazily.
+
+        A batch is generated and postprocessed when the previous one is
+        consumed, so generated objects aren't kept in memory. Size of the
+        batches is set by `batch_size` param. Values of unique fields are
+        remembered to check the uniqueness, so with unique fields the memory
+        grows with number of objects (use :class:`mixer.unique.BloomTracker`
+        to bound it).
+
+        :param scheme: Scheme class for generation or string with class path.
+        :param count: Number of instances (infinite by default)
+        :param values: Keyword params with predefined values
+        :return iterator: Lists of generated instances
+
+        ::
+
+            mixer = Mixer(batch_size=1000)
+
+            for users in mixer.batches(User, 10 ** 7):
+                writer.writerows([user.name] for user in users)
+
+        """
+        return self._blend_batches(scheme, count, values)
+
+    def _blend_batches(self, scheme, count, values, workers=None, seed=None):
+        """ Generate batches of objects.
+
+        The options are separated from `values`, so they never clash with
+        names of scheme's fields.
+
+        :return iterator: Lists of generated objects
+
+        """
+        workers = workers or self.params.get('workers')
+        if workers or seed is not None:
+            return self.__iter_chunks(scheme, count, values, workers, seed)
+
+        return self.__iter_batches(scheme, count, values)
+
+    def __iter_batches(self, scheme, count, values, batch_size=None):
+        type_mixer = self.get_typemixer(scheme)
+        batch_size = batch_size or self.params.get('batch_size') or BATCH_SIZE
+        while count is None or count > 0:
+            size = batch_size if count is None else min(count, batch_size)
+            try:
+                yield type_mixer.blend_many(size, values)
+            except Exception as e:
+                if not self.params.get('silence'):
+                    self.__log_exception(scheme, e)
+                    raise
+
+                # Keep the objects which could be generated
+                yield [self.blend(scheme, **values) for _ in range(size)]
+
+            if count is not None:
+                count -= size
+
+    def __iter_chunks(self, scheme, count, values, workers=None, seed=None):
+        """ Generate chunks with own seeds and shards of unique values.
+
+        The chunks are the same with or without workers.
+
+        """
+        if count is None:
+            raise ValueError('Parallel and seeded generation need a count')
+
+        streams = self.get_streams()
+        if seed is None and streams:
+            seed = streams.get((scheme, None)).getrandbits(64)
+
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+
+        chunks = max(1, min(count, PARALLEL_CHUNKS))
+        sizes = [count // chunks + (num < count % chunks) for num in range(chunks)]
+
+        # Generators and functions are not picklable, call them here
+        rows = dict(
+            (name, [next(value) if isinstance(value, GeneratorType) else value()
+                    for _ in range(count)])
+            for name, value in values.items()
+            if isinstance(value, (
+                GeneratorType, FunctionType, MethodType, BuiltinFunctionType, LazyFormatter)))
+
+        tasks = []
+        start = 0
+        for num, size in enumerate(sizes):
+            chunk_values = dict(values)
+            for name, column in rows.items():
+                chunk_values[name] = _Rows(column[start:start + size])
+            tasks.append((size, '%s:%s' % (seed, num), (num, chunks, seed), chunk_values))
+            start += size
+
+        if not workers:
+            for task in tasks:
+                yield self._blend_chunk(scheme, *task)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers get the typemixer with registered fabrics and middlewares
+        self.get_typemixer(scheme)
+
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            futures = [executor.submit(_blend_chunk, scheme, *task) for task in tasks]
+
+            for task, future in zip(tasks, futures):
+                try:
+                    targets, committed, unique = future.result()
+                except Exception as e:
+                    if not self.params.get('silence'):
+                        self.__log_exception(scheme, e)
+                        raise
+
+                    yield [None] * task[0]
+                    continue
+
+                self._load_unique(unique)
+
+                # A worker couldn't save the objects (see :meth:`Mixer.init_worker`)
+                if self.params.get('commit') and not committed:
+                    targets = self.postprocess_many(targets)
+
+                yield targets
+
+    def _blend_chunk(self, scheme, count, seed, shard, values):
+        """ Generate a chunk of a seeded generation.
+
+        :return list: Generated objects
+
+        """
+        values = dict(
+            (name, (v for v in value) if isinstance(value, _Rows) else value)
+            for name, value in values.items())
+
+        # Unique fabrics and pools of the chunk depend only on its seed
+        for _, type_mixer in self.__own_typemixers():
+            type_mixer.reset_unique_fabrics()
+            type_mixer.reset_pools()
+
+        # Fields of the chunk draw values from streams of its seed
+        root = self.params.get('seed')
+        self.__init_params__(seed=seed, shard=shard)
+        previous = faker.swap_random(random.Random(seed))
+        try:
+            return [
+                target for batch in self.__iter_batches(scheme, count, values)
+                for target in batch]
+        finally:
+            faker.swap_random(previous)
+            self.params.pop('shard', None)
+            self.__init_params__(seed=root)
+
+            # Shards of unique fabrics aren't used out of the chunk
+            for _, type_mixer in self.__own_typemixers():
+                type_mixer.reset_unique_fabrics()
+
+    def init_worker(self):
+        """ Prepare the mixer to work in a worker process.
+
+        Backends drop DB connections which can't be shared between processes
+        here. Workers don't save objects when `commit` param is dropped, the
+        objects are saved by the parent process.
+
+        """
+        pass
+
+    def __own_typemixers(self):
+        return [(key[1:], type_mixer) for key, type_mixer in self.type_mixers.items()]
+
+    def _dump_unique(self):
+        """ Get unique values generated by the mixer's typemixers.
+
+        :return list:
+
+        """
+        return [
+            (key, type_mixer.dump_state()['unique'])
+            for key, type_mixer in self.__own_typemixers()]
+
+    def _load_unique(self, unique):
+        """ Merge unique values from :meth:`Mixer._dump_unique`. """
+        for (scheme, fake, factory), values in unique:
+            type_mixer = self.type_mixer_cls(scheme, mixer=self, fake=fake, factory=factory)
+            type_mixer.load_state(dict(unique=values))
+
+    def __getstate__(self):
+        """ Prepare the mixer to be sent into a worker process.
+
+        Registered fabrics, middlewares and generated unique values of the
+        typemixers are sent too, so they have to be picklable.
+
+        """
+        state = dict(self.__dict__)
+        state['params'] = dict(self.params)
+        state.pop('faker', None)
+        state['type_mixers'] = [
+            (key, type_mixer.dump_state())
+            for key, type_mixer in self.__own_typemixers()]
+        return state
+
+    def __setstate__(self, state):
+        type_mixers = state.pop('type_mixers', [])
+        self.__dict__.update(state)
+        self.faker = faker
+        self.type_mixers = TypeMixerCache(self.params.get('cache_size'))
+        for (scheme, fake, factory), type_mixer_state in type_mixers:
+            type_mixer = self.type_mixer_cls(scheme, mixer=self, fake=fake, factory=factory)
+            type_mixer.load_state(type_mixer_state)
+
+    @staticmethod
+    def __log_exception(scheme, exc):
+        if exc.args:
+            exc.args = ('Mixer (%s): %s' % (scheme, exc.args[0]),) + exc.args[1:]
+        LOGGER.error(traceback.format_exc())
+
+    def get_streams(self):
+        """ Get random streams of the mixer's `seed` param.
+
+        See :mod:`mixer.rng`.
+
+        :return Streams: Streams or None
+
+        """
+        seed = self.params.get('seed')
+        if seed is None:
+            return None
+
+        streams = self.__streams
+        rng = self.params.get('rng') or random.Random
+        if streams is None or streams.seed != seed or streams.rng is not rng:
+            streams = self.__streams = Streams(seed, rng)
+        return streams
+
     def get_typemixer(self, scheme):
         """ Return a cached typemixer instance.
 
@@ -593,6 +1650,30 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         """
         return target
 
+    def postprocess_many(self, targets):
+        """ Run the code after generation of a batch.
+
+        Backends override the method to save a batch at once.
+
+        :return list: targets
+
+        """
+        return [self.postprocess(target) for target in targets]
+
+    async def apostprocess_many(self, targets):
+        """ Run the code after generation of a batch asynchronously.
+
+        Backends with async DB API override the method. By default
+        :meth:`Mixer.postprocess_many` is called in a thread.
+
+        :return list: targets
+
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.postprocess_many, targets)
+
     @staticmethod # noqa
     def sequence(*args):
         """ Create a sequence for predefined values.
@@ -663,10 +1744,21 @@ class Mixer(_.with_metaclass(_MetaMixer)):
                 counter += 1
         return gen2()
 
-    def cycle(self, count=5):
+    def cycle(self, count=5, workers=None, seed=None):
         """ Generate a few objects. The syntastic sugar for cycles.
 
+        With `workers` or `seed` the work is split to chunks with seeds
+        derived from `seed` (a random one by default), so the result doesn't
+        depend on number of workers. Unique values of the chunks are disjoint.
+        With `workers` the chunks are generated in a process pool. Workers
+        get registered fabrics, middlewares and unique values of the mixer
+        (see :meth:`Mixer.__getstate__`), save objects themselves when
+        backend allows that (see :meth:`Mixer.init_worker`) and return them
+        to the caller, so a scheme and values should be picklable.
+
         :param count: List of objects or integer.
+        :param workers: Number of worker processes (`workers` param by default)
+        :param seed: A seed for reproducible parallel generation
         :returns: ProxyMixer
 
         ::
@@ -679,7 +1771,12 @@ class Mixer(_.with_metaclass(_MetaMixer)):
             apples = mixer.cycle(10).blend(
                 Apple, title=mixer.sequence('apple_{0}')
 
+            users = mixer.cycle(10 ** 6, workers=8, seed=42).blend(User)
+
         """
+        if workers or seed is not None:
+            return ProxyMixer(self, count, workers=workers, seed=seed)
+
         return ProxyMixer(self, count)
 
     def middleware(self, scheme):
@@ -768,7 +1865,7 @@ class Mixer(_.with_metaclass(_MetaMixer)):
                 self.assertFalse(Hole.objects.count())
 
         """
-        _params = dict((k, v) for k, v in self.params.items() if k in params)
+        _params = dict((k, self.params.get(k)) for k in params)
         _params['locale'] = self.faker.locale
 
         try:
@@ -777,6 +1874,50 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         finally:
             self.__init_params__(**_params)
 
+    def clear_cache(self):
+        """ Drop cached typemixers of the mixer.
+
+        Registered fabrics, middlewares and unique values of the typemixers
+        are dropped too. Size of the cache could be bound by `cache_size`
+        param (least recently used typemixers are dropped).
+
+        """
+        self.type_mixers.clear()
+
+    def reset_unique(self, scheme=None):
+        """ Forget generated unique values of the scheme (all by default).
+
+        ::
+
+            mixer.reset_unique(User)
+
+        """
+        type_mixers = self.__own_typemixers() if scheme is None else [
+            (None, self.get_typemixer(scheme))]
+        for _, type_mixer in type_mixers:
+            type_mixer.reset_unique()
+
+    @contextmanager
+    def unique_scope(self):
+        """ Generate unique values which are forgotten after the scope.
+
+        Values generated before the scope are not checked in the scope.
+
+        ::
+
+            with mixer.unique_scope():
+                users = mixer.cycle(10).blend(User)
+
+        """
+        previous = dict(
+            (key, type_mixer.reset_unique()) for key, type_mixer in self.__own_typemixers())
+
+        try:
+            yield self
+        finally:
+            for key, type_mixer in self.__own_typemixers():
+                type_mixer.reset_unique(previous.get(key))
+
     def reload(self, *objs):
         """ Reload the objects from storage. """
         results = []
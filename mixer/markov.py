@@ -1,16 +1,72 @@
+""" Generate sentences by a Markov chain of words.
+
+mixer.markov
+~~~~~~~~~~~~
+
+A trained chain is stored in a compact file: interned words, transitions
+of states (n-grams of word ids) by CSR-style arrays and float32
+probabilities. The file is opened by `mmap`, so a chain loads instantly
+and worker processes share its pages: ::
+
+    from mixer.markov import MarkovChain
+
+    chain = MarkovChain('corpus.db')
+    chain.generateDatabase(text)
+    chain.dumpdb()
+
+Pickled databases of the old format are loaded too, `dumpdb` converts
+them to the compact format.
+
+Texts are counted by :class:`MarkovTrainer` as a stream (a string, a file
+object or an iterator of strings), so a corpus isn't loaded to memory.
+Large corpora could be split to files and counted in processes: ::
+
+    from mixer.markov import CompactDB, MarkovChain, train_files
+
+    chain = MarkovChain('corpus.db')
+    trainer = train_files(['part1.txt', 'part2.txt'], workers=2)
+    chain.db = CompactDB(trainer.build(min_count=2))
+    chain.dumpdb()
+
+:class:`MarkovText` is a fabric of texts for a factory: ::
+
+    from mixer import mix_types as t
+    from mixer.factory import GenFactory
+    from mixer.markov import MarkovText
+
+    class Factory(GenFactory):
+        generators = {t.Text: MarkovText('corpus.db')}
+
+:copyright: 2013 by Kirill Klenov.
+:license: BSD, see LICENSE for more details.
+
+"""
 from __future__ import division
 
-# use cPickle when using python2 for better performance
-try:
-    import cPickle as pickle
-except ImportError:
-    import pickle
 import logging
+import mmap
 import os
-import random
 import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from functools import partial
+from itertools import accumulate, groupby
+
+from ._faker import faker
+from .pool import Pool
+
+
+MAGIC = b'MXMARKOV'
 
+# Magic, max order, bits of a word id in a state's key, number of words,
+# states and transitions, size of the words, padding
+HEADER = struct.Struct('<8sIIIIQQQ')
+
+# Bits of a word id in keys of trainers' counts
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
 
 PUNCTUATION = re.compile(r"([\.,;!?])")
 
@@ -28,19 +84,407 @@ def _wordIter(text, separator='.'):
     """
     An iterator over the 'words' in the given text, as defined by
     the regular expression given as separator.
+    """
+    return _sentences([text], separator)
+
+
+def _sentences(chunks, separator):
+    """ Iterate over the 'sentences' of a stream of text's chunks.
+
+    A part after the last separator of a chunk is continued by the next one.
+
     """
     exp = re.compile(separator)
-    pos = 0
-    for occ in exp.finditer(text):
-        sub = text[pos:occ.start()].strip()
-        if sub:
-            yield sub
-        pos = occ.start() + 1
-    if pos < len(text):
-        # take case of the last part
-        sub = text[pos:].strip()
-        if sub:
-            yield sub
+    rest = ''
+    for chunk in chunks:
+        text = rest + chunk
+        pos = 0
+        for occ in exp.finditer(text):
+            sub = text[pos:occ.start()].strip()
+            if sub:
+                yield sub
+            pos = occ.start() + 1
+        rest = text[pos:]
+
+    # take case of the last part
+    sub = rest.strip()
+    if sub:
+        yield sub
+
+
+def _new_db():
+    return defaultdict(lambda: defaultdict(float))
+
+
+def _align(pos):
+    return pos + -pos % 8
+
+
+def _section(view, pos, typecode, count):
+    end = pos + array(typecode).itemsize * count
+    return view[pos:end].cast(typecode), _align(end)
+
+
+class CompactDB(object):
+
+    """ Read-only transitions of a Markov chain in a buffer.
+
+    States are n-grams of word ids packed to integers and sorted, so a
+    state is found by bisection. Transitions of a state are a slice of the
+    successors and cumulative probabilities arrays (the most probable
+    first), so the next word is sampled by bisection too.
+
+    :param buffer: A buffer made by :meth:`CompactDB.build` (or an mmap)
+    :param path: A path of the buffer's file
+
+    """
+
+    def __init__(self, buffer, path=None):
+        self.buffer = buffer
+        self.path = path
+        view = memoryview(buffer)
+        magic, self.order, self.bits, words, states, transitions, size, _ = \
+            HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError('Not a database of a Markov chain')
+
+        self.word_offsets, pos = _section(view, HEADER.size, 'Q', words + 1)
+        self.words, pos = view[pos:pos + size], _align(pos + size)
+        self.keys, pos = _section(view, pos, 'Q', states)
+        self.offsets, pos = _section(view, pos, 'Q', states + 1)
+        self.successors, pos = _section(view, pos, 'I', transitions)
+        self.cumprobs, pos = _section(view, pos, 'f', transitions)
+
+    def __reduce__(self):
+        if self.path:
+            return (type(self).open, (self.path,))
+        return (type(self), (bytes(self.buffer),))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        for state in range(len(self.keys)):
+            yield self.get_key(state)
+
+    def __contains__(self, words):
+        return self.find(words) >= 0
+
+    def __getitem__(self, words):
+        state = self.find(words)
+        if state < 0:
+            raise KeyError(words)
+        start, cumprobs = self.offsets[state], self.cumprobs
+        return dict(
+            (self.word(self.successors[pos]),
+             cumprobs[pos] - cumprobs[pos - 1] if pos > start else cumprobs[pos])
+            for pos in range(start, self.offsets[state + 1]))
+
+    @classmethod
+    def open(cls, path):
+        """ Map a database's file to memory.
+
+        :return CompactDB:
+
+        """
+        with open(path, 'rb') as dbfile:
+            return cls(mmap.mmap(dbfile.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    @classmethod
+    def from_dict(cls, db):
+        """ Compile a database of nested dicts (word tuple -> word -> probability).
+
+        :return CompactDB:
+
+        """
+        return cls(MarkovTrainer.from_db(db).build())
+
+    def to_dict(self):
+        """ Get the database as nested dicts.
+
+        :return defaultdict:
+
+        """
+        db = _new_db()
+        for words in self:
+            db[words].update(self[words])
+        return db
+
+    def choose(self, state, sample):
+        """ Choose a successor of a state by a sample from [0, 1).
+
+        :return int: An id of the word
+
+        """
+        start, end = self.offsets[state], self.offsets[state + 1]
+        if start == end:
+            return 0
+
+        # Probabilities could sum to a bit more or less than 1
+        cumprobs = self.cumprobs
+        pos = bisect_right(cumprobs, sample * cumprobs[end - 1], start, end)
+        return self.successors[min(pos, end - 1)]
+
+    def word(self, num):
+        """ Get a word by its id. """
+        return str(self.words[self.word_offsets[num]:self.word_offsets[num + 1]], 'utf-8')
+
+    def index(self, word):
+        """ Get an id of a word (words are sorted by their UTF-8 bytes).
+
+        :return int: The id or None if the word is unknown
+
+        """
+        word = word.encode('utf-8')
+        offsets, words = self.word_offsets, self.words
+        low, high = 0, len(offsets) - 1
+        while low < high:
+            mid = (low + high) // 2
+            if words[offsets[mid]:offsets[mid + 1]].tobytes() < word:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low < len(offsets) - 1 and words[offsets[low]:offsets[low + 1]] == word:
+            return low
+        return None
+
+    def get_key(self, state):
+        """ Get words of a state. """
+        return tuple(self.word(num) for num in _unpack(self.keys[state], self.bits))
+
+    def find(self, words):
+        """ Find a state by its words.
+
+        :return int: The state or -1
+
+        """
+        return self.find_ids([self.index(word) for word in words])
+
+    def find_ids(self, ids):
+        """ Find a state by ids of its words.
+
+        :return int: The state or -1
+
+        """
+        if None in ids or not 0 < len(ids) <= self.order:
+            return -1
+
+        key = _pack(ids, self.bits)
+        state = bisect_left(self.keys, key)
+        if state < len(self.keys) and self.keys[state] == key:
+            return state
+        return -1
+
+
+def _pack(ids, bits):
+    key = 0
+    for num in ids:
+        key = key << bits | num + 1
+    return key
+
+
+def _unpack(key, bits):
+    mask, ids = (1 << bits) - 1, []
+    while key:
+        ids.append((key & mask) - 1)
+        key >>= bits
+    ids.reverse()
+    return ids
+
+
+class MarkovTrainer(object):
+
+    """ Count transitions of words in a stream of texts.
+
+    Counts are kept in a flat dict of integers: a key is ids of a state's
+    words and of the next word packed to an integer. When counts exceed
+    `max_transitions`, rare transitions are pruned (so counts of a huge
+    corpus fit the memory and are approximate).
+
+    :param max_transitions: A limit of counted transitions
+
+    """
+
+    def __init__(self, max_transitions=None):
+        self.max_transitions = max_transitions
+        self.words = ['']
+        self.ids = {'': 0}
+        self.counts = {}
+
+    @classmethod
+    def from_db(cls, db):
+        """ Make a trainer with probabilities of a database as counts.
+
+        :param db: Nested dicts (word tuple -> word -> probability) or
+                   a :class:`CompactDB`
+        :return MarkovTrainer:
+
+        """
+        trainer = cls()
+        for words in db:
+            state = _pack([trainer.intern(word) for word in words], ID_BITS) << ID_BITS
+            for word, prob in db[words].items():
+                key = state | trainer.intern(word)
+                trainer.counts[key] = trainer.counts.get(key, 0) + prob
+        return trainer
+
+    def intern(self, word):
+        """ Get an id of a word.
+
+        :return int:
+
+        """
+        num = self.ids.get(word)
+        if num is None:
+            num = self.ids[word] = len(self.words)
+            self.words.append(word)
+        return num
+
+    def feed(self, source, sentenceSep='[.!?\n]', n=2):
+        """ Count transitions of words of order 1-`n`.
+
+        :param source: A string, a file object or an iterator of strings
+
+        """
+        intern = self.intern
+        chunks = [source] if isinstance(source, str) else source
+        for sentence in _sentences(chunks, sentenceSep):
+            words = [intern(word) for word in sentence.split()]
+            if not words:
+                continue
+
+            # first word follows a sentence end
+            counts = self.counts
+            key = 1 << ID_BITS | words[0]
+            counts[key] = counts.get(key, 0) + 1
+
+            # Keys of states are extended by the next words
+            for i in range(len(words) - 1):
+                state = 0
+                for order in range(1, min(n, len(words) - 1 - i) + 1):
+                    state = state << ID_BITS | words[i + order - 1] + 1
+                    key = state << ID_BITS | words[i + order]
+                    counts[key] = counts.get(key, 0) + 1
+
+            # last words precede a sentence end
+            for order in range(1, n + 1):
+                key = _pack(words[len(words) - order:len(words)], ID_BITS) << ID_BITS
+                counts[key] = counts.get(key, 0) + 1
+
+            if self.max_transitions and len(counts) > self.max_transitions:
+                self.shrink()
+
+    def update(self, trainer):
+        """ Add counts of other trainer (e.g. of a shard). """
+        ids = [self.intern(word) for word in trainer.words]
+        counts = self.counts
+        for key, count in trainer.counts.items():
+            state = _pack([ids[num] for num in _unpack(key >> ID_BITS, ID_BITS)], ID_BITS)
+            key = state << ID_BITS | ids[key & ID_MASK]
+            counts[key] = counts.get(key, 0) + count
+
+        if self.max_transitions and len(counts) > self.max_transitions:
+            self.shrink()
+
+    def prune(self, min_count):
+        """ Drop transitions which are counted less than `min_count` times. """
+        self.counts = dict(
+            (key, count) for key, count in self.counts.items() if count >= min_count)
+
+    def shrink(self):
+        """ Prune rare transitions until a half of `max_transitions` is left. """
+        min_count = 2
+        while len(self.counts) > self.max_transitions // 2:
+            self.prune(min_count)
+            min_count *= 2
+
+    def build(self, min_count=None):
+        """ Normalize counts to probabilities in the compact format.
+
+        :param min_count: Drop transitions which are counted less
+        :return bytes: A buffer of :class:`CompactDB`
+
+        """
+        # Words are sorted by their bytes, so they are found by bisection
+        vocab = sorted((word.encode('utf-8'), num) for num, word in enumerate(self.words))
+        ids = [0] * len(vocab)
+        for new, (_, num) in enumerate(vocab):
+            ids[num] = new
+
+        # Transitions are grouped by states in order of the trainer's ids and
+        # then the groups are sorted by keys of the states with sorted ids
+        counts = self.counts
+        order, bits = 1, len(vocab).bit_length()
+        states, starts, successors, cumprobs = array('Q'), array('Q'), array('I'), array('f')
+        for state, keys in groupby(sorted(
+                key for key, count in counts.items() if min_count is None or count >= min_count),
+                key=lambda key: key >> ID_BITS):
+            words = _unpack(state, ID_BITS)
+            if len(words) * bits > 64:
+                raise ValueError('States of order %s don\'t fit 64 bits' % len(words))
+
+            order = max(order, len(words))
+            states.append(_pack([ids[num] for num in words], bits))
+            starts.append(len(successors))
+
+            keys = list(keys)
+            if len(keys) == 1:
+                successors.append(ids[keys[0] & ID_MASK])
+                cumprobs.append(1.0 if counts[keys[0]] else 0.0)
+            else:
+                keys.sort(key=counts.__getitem__, reverse=True)
+                weights = [counts[key] for key in keys]
+                total = sum(weights) or 1
+                successors.extend([ids[key & ID_MASK] for key in keys])
+                cumprobs.extend([running / total for running in accumulate(weights)])
+
+        starts.append(len(successors))
+        ordered = sorted(range(len(states)), key=states.__getitem__)
+        keys, offsets = array('Q', [states[num] for num in ordered]), array('Q', [0])
+        grouped, successors, cumprobs = (successors, cumprobs), array('I'), array('f')
+        for num in ordered:
+            start, end = starts[num], starts[num + 1]
+            successors.extend(grouped[0][start:end])
+            cumprobs.extend(grouped[1][start:end])
+            offsets.append(len(successors))
+
+        word_offsets = array('Q', [0])
+        for word, _ in vocab:
+            word_offsets.append(word_offsets[-1] + len(word))
+
+        words = b''.join(word for word, _ in vocab)
+        sections = [
+            HEADER.pack(
+                MAGIC, order, bits, len(vocab), len(keys), len(successors), len(words), 0),
+            word_offsets.tobytes(), words, keys.tobytes(),
+            offsets.tobytes(), successors.tobytes(), cumprobs.tobytes()]
+        return b''.join(section + b'\0' * (-len(section) % 8) for section in sections)
+
+
+def _train_file(path, sentenceSep, n, max_transitions):
+    trainer = MarkovTrainer(max_transitions)
+    with open(path, encoding='utf-8') as source:
+        trainer.feed(source, sentenceSep, n)
+    return trainer
+
+
+def train_files(paths, sentenceSep='[.!?\n]', n=2, max_transitions=None, workers=None):
+    """ Count transitions of files in processes (a file is a shard) and merge the counts.
+
+    :param workers: A number of processes (CPUs by default)
+    :return MarkovTrainer:
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    trainer = MarkovTrainer(max_transitions)
+    train = partial(
+        _train_file, sentenceSep=sentenceSep, n=n, max_transitions=max_transitions)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard in executor.map(train, paths):
+            trainer.update(shard)
+    return trainer
 
 
 class MarkovChain(object):
@@ -49,54 +493,53 @@ class MarkovChain(object):
         self.dbFilePath = dbFilePath
         if not dbFilePath:
             self.dbFilePath = os.path.join(os.path.dirname(__file__), "markovdb")
+
+        # Pickled databases of the old format are converted
+        import pickle
+
         try:
             with open(self.dbFilePath, 'rb') as dbfile:
-                self.db = pickle.load(dbfile)
-        except (IOError, ValueError):
+                compact = dbfile.read(len(MAGIC)) == MAGIC
+                if not compact:
+                    dbfile.seek(0)
+                    db = pickle.load(dbfile)
+
+            self.db = CompactDB.open(self.dbFilePath) if compact else CompactDB.from_dict(db)
+        except (IOError, ValueError, EOFError, pickle.UnpicklingError):
             logging.warn('Database file corrupt or not found, using empty database')
-            self.db = defaultdict(lambda: defaultdict(lambda: 1.0))
-
-    def generateDatabase(self, textSample, sentenceSep='[.!?\n]', n=2):
-        """ Generate word probability database from raw content string """
-        # I'm using the database to temporarily store word counts
-        textSample = _wordIter(textSample, sentenceSep)  # get an iterator for the 'sentences'
-        # We're using '' as special symbol for the beginning
-        # of a sentence
-        self.db[('',)][''] = 0.0
-        for line in textSample:
-            words = line.strip().split()  # split words in line
-            if len(words) == 0:
-                continue
-            # first word follows a sentence end
-            self.db[("",)][words[0]] += 1
-
-            for order in range(1, n+1):
-                for i in range(len(words) - 1):
-                    if i + order >= len(words):
-                        continue
-                    word = tuple(words[i:i + order])
-                    self.db[word][words[i + order]] += 1
-
-                # last word precedes a sentence end
-                self.db[tuple(words[len(words) - order:len(words)])][""] += 1
-
-        # We've now got the db filled with parametrized word counts
-        # We still need to normalize this to represent probabilities
-        for word in self.db:
-            wordsum = 0
-            for nextword in self.db[word]:
-                wordsum += self.db[word][nextword]
-            if wordsum != 0:
-                for nextword in self.db[word]:
-                    self.db[word][nextword] /= wordsum
-
-    def dumpdb(self):
+            self.db = CompactDB.from_dict({})
+
+    def generateDatabase(self, textSample, sentenceSep='[.!?\n]', n=2, min_count=None):
+        """ Generate word probability database from raw content string
+
+        `textSample` could be a file object or an iterator of strings too,
+        it's read by lines. Probabilities of the current database are
+        counted with the text.
+
+        """
+        trainer = MarkovTrainer.from_db(self.db)
+        trainer.feed(textSample, sentenceSep, n)
+        self.db = CompactDB(trainer.build(min_count))
+
+    def dumpdb(self, dbFilePath=None):
+        """ Write the database in the compact format.
+
+        A file is replaced atomically, so processes which mapped the old
+        file keep reading it.
+
+        """
+        import tempfile
+
+        dbFilePath = dbFilePath or self.dbFilePath
         try:
-            with open(self.dbFilePath, 'wb') as dbfile:
-                pickle.dump(self.db, dbfile)
+            dbfile = tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(os.path.abspath(dbFilePath)), delete=False)
+            with dbfile:
+                dbfile.write(self.db.buffer)
+            os.replace(dbfile.name, dbFilePath)
             # It looks like db was written successfully
             return True
-        except IOError:
+        except (IOError, OSError):
             logging.warn('Database file could not be written')
             return False
 
@@ -104,6 +547,15 @@ class MarkovChain(object):
         """ Generate a "sentence" with the database of known text """
         return self._accumulateWithSeed(('',))
 
+    def generateStrings(self, count):
+        """ Generate `count` "sentences" with the database of known text
+
+        Found states and decoded words are shared by the sentences.
+
+        """
+        states, words = {}, {}
+        return [self._accumulateWithSeed(('',), states, words) for _ in range(count)]
+
     def generateStringWithSeed(self, seed):
         """ Generate a "sentence" with the database and a given word """
         # using str.split here means we're contructing the list in memory
@@ -116,39 +568,127 @@ class MarkovChain(object):
                                                     + seed)
         return self._accumulateWithSeed(words)
 
-    def _accumulateWithSeed(self, seed):
+    def _accumulateWithSeed(self, seed, states=None, words=None):
         """ Accumulate the generated sentence with a given single word as a
         seed """
-        nextWord = self._nextWord(seed)
+        db = self.db
+        states = {} if states is None else states
+        words = {} if words is None else words
+        ids = [db.index(word) for word in seed]
+        nextWord = self._nextWord(ids, states)
         sentence = list(seed) if seed else []
         while nextWord:
-            sentence.append(nextWord)
-            nextWord = self._nextWord(sentence)
+            word = words.get(nextWord)
+            if word is None:
+                word = words[nextWord] = db.word(nextWord)
+            sentence.append(word)
+            ids.append(nextWord)
+            nextWord = self._nextWord(ids, states)
         return ' '.join(sentence).strip()
 
-    def _nextWord(self, lastwords):
-        lastwords = tuple(lastwords)
-        if lastwords != ('',):
-            while lastwords not in self.db:
-                lastwords = lastwords[1:]
-                if not lastwords:
-                    return ''
-        probmap = self.db[lastwords]
-        sample = random.random()
-        # since rounding errors might make us miss out on some words
-        maxprob = 0.0
-        maxprobword = ""
-        for candidate in probmap:
-            # remember which word had the highest probability
-            # this is the word we'll default to if we can't find anything else
-            if probmap[candidate] > maxprob:
-                maxprob = probmap[candidate]
-                maxprobword = candidate
-            if sample > probmap[candidate]:
-                sample -= probmap[candidate]
-            else:
-                return candidate
-        # getting here means we haven't found a matching word. :(
-        return maxprobword
+    def _nextWord(self, lastwords, states=None):
+        """ Get an id of the next word by ids of the last words (0 is the end)
+
+        `states` caches found states by their ids.
+
+        """
+        db = self.db
+        key = tuple(lastwords[-db.order:])
+        state = states.get(key) if states is not None else None
+        if state is None:
+            state = -1
+            for size in range(len(key), 0, -1):
+                state = db.find_ids(key[-size:])
+                if state >= 0:
+                    break
+
+            if states is not None:
+                states[key] = state
+
+        if state < 0:
+            return 0
+
+        return db.choose(state, faker.random.random())
+
+
+# Path -> a chain loaded in the process
+_CHAINS = {}
+
+
+def load_chain(path):
+    """ Get a chain of the database's file, it's loaded once per process.
+
+    :return MarkovChain:
+
+    """
+    path = os.path.abspath(path)
+    chain = _CHAINS.get(path)
+    if chain is None:
+        chain = _CHAINS[path] = MarkovChain(path)
+    return chain
+
+
+class MarkovText(Pool):
+
+    """ Give out texts of sentences of a Markov chain.
+
+    Sentences are generated by batches and reused as values of
+    :class:`mixer.pool.Pool`, a text is joined from the next sentences
+    while it isn't longer than `max_nb_chars` (as `faker.text`). So a text
+    costs about a `faker.text` call. Mixer binds the length to `max_length`
+    of a field.
+
+    :param path: A path of the chain's database
+    :param max_nb_chars: (200) Max length of a text
+    :param size: (1000) Number of sentences in a batch
+    :param reuse: (10) How many times a batch is given out
+
+    """
+
+    def __init__(self, path, max_nb_chars=200, size=1000, reuse=10):
+        super(MarkovText, self).__init__(self.sentence, size=size, reuse=reuse)
+        self.path = path
+        self.max_nb_chars = max_nb_chars
+
+    def __call__(self):
+        text = super(MarkovText, self).__call__()
+        while True:
+            if self.index >= len(self.values):
+                self.refill()
+
+            sentence = self.values[self.index]
+            if len(text) + len(sentence) >= self.max_nb_chars:
+                return text
+
+            text = '%s %s' % (text, sentence)
+            self.index += 1
+
+    def bind(self, max_nb_chars=None, **kwargs):
+        """ Get a fabric of shorter texts.
+
+        :return MarkovText:
+
+        """
+        if kwargs:
+            return super(MarkovText, self).bind(max_nb_chars=max_nb_chars, **kwargs)
+
+        return type(self)(
+            self.path, min(max_nb_chars or self.max_nb_chars, self.max_nb_chars),
+            self.size, self.reuse)
+
+    def sentence(self):
+        """ Generate a sentence which isn't longer than `max_nb_chars`. """
+        sentence = load_chain(self.path).generateString()
+        if not sentence:
+            raise ValueError('The Markov chain is empty: %s' % self.path)
+
+        if sentence[-1] not in '.!?':
+            sentence += '.'
+
+        if len(sentence) > self.max_nb_chars:
+            cut = sentence.rfind(' ', 0, self.max_nb_chars)
+            sentence = sentence[:cut if cut > 0 else self.max_nb_chars]
+        return sentence
+
 
 # pylama:ignore=D
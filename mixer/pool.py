@@ -0,0 +1,92 @@
+""" Pools of pre-generated values.
+
+mixer.pool
+~~~~~~~~~~
+
+Expensive fabrics (Faker's names, texts, addresses) could be pooled by
+`pools` param of a mixer. Keys of the param are (field's name, type) as
+keys of :attr:`mixer.factory.GenFactory.fakers` (`None` type matches any
+type), values are classes (or functions) which wrap a fabric: ::
+
+    from functools import partial
+    from mixer.main import Mixer
+    from mixer.pool import Pool
+
+    mixer = Mixer(pools={
+        ('name', str): partial(Pool, size=1000, reuse=10),
+        ('body', None): Pool,
+    })
+
+Pools aren't used for unique fields and registered fabrics.
+
+:copyright: 2013 by Kirill Klenov.
+:license: BSD, see LICENSE for more details.
+
+"""
+from __future__ import absolute_import
+
+from functools import partial
+
+from ._faker import faker
+
+
+class Pool(object):
+
+    """ Give out values of a fabric from a pre-generated pool.
+
+    Values are generated by batches of `size` and given out in O(1).
+    A batch is given out `reuse` times (in a new random order each time),
+    so a value costs `1 / reuse` calls of the fabric. Reused values are
+    shared between objects, so mutable values should not be reused.
+
+    Batches are generated in the current thread: Faker's random state is
+    not thread-safe and seeded generation should not depend on timing.
+
+    :param fabric: A function which makes values
+    :param size: (1000) Number of values in a batch
+    :param reuse: (1) How many times a batch is given out
+
+    """
+
+    def __init__(self, fabric, size=1000, reuse=1):
+        self.fabric = fabric
+        self.size = size
+        self.reuse = reuse
+        self.values = []
+        self.index = 0
+        self.passes = 0
+
+    def __call__(self):
+        if self.index >= len(self.values):
+            self.refill()
+
+        value = self.values[self.index]
+        self.index += 1
+        return value
+
+    def refill(self):
+        """ Shuffle the batch to give it out again or generate a new one. """
+        self.passes += 1
+        if self.values and self.passes < self.reuse:
+            faker.random.shuffle(self.values)
+        else:
+            fabric = self.fabric
+            self.values = [fabric() for _ in range(self.size)]
+            self.passes = 0
+
+        self.index = 0
+
+    def bind(self, **kwargs):
+        """ Get a fabric with arguments.
+
+        Pooled values are made without arguments, so the pool isn't used.
+
+        :return function:
+
+        """
+        return partial(self.fabric, **kwargs)
+
+    def clear(self):
+        """ Drop pre-generated values. """
+        self.values = []
+        self.index = self.passes = 0
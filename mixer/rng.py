@@ -0,0 +1,73 @@
+""" Seedable random streams.
+
+mixer.rng
+~~~~~~~~~
+
+Values of a mixer with `seed` param are reproducible. Every (scheme, field)
+draws its values from its own random stream derived from the seed, so
+adding a field (or blending other schemes in between) doesn't change values
+of the other fields: ::
+
+    from mixer.main import Mixer
+
+    mixer = Mixer(seed=42)
+    users = mixer.cycle(10).blend(User)
+
+Parallel and seeded generation (``mixer.cycle(count, workers=4, seed=42)``)
+derives streams from the seeds of its chunks.
+
+Streams are made by `rng` param of a mixer: a class (or a function) which
+gets an integer seed and returns an object with :class:`random.Random`
+interface (Faker's providers draw from it). :class:`random.Random` is used
+by default: its generator is implemented in C, so a scalar draw is cheaper
+than with any engine which is called from Python (NumPy's generators are
+used for columns, see :mod:`mixer.vector`).
+
+:copyright: 2013 by Kirill Klenov.
+:license: BSD, see LICENSE for more details.
+
+"""
+from __future__ import absolute_import
+
+import hashlib
+import random
+
+
+def derive_seed(seed, key):
+    """ Derive a seed of an independent stream from a root seed.
+
+    Keys are hashed by their reprs, so classes of schemes give the same
+    seeds in all processes.
+
+    :return int: A 128-bit seed
+
+    """
+    data = repr((seed, key)).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), 'little')
+
+
+class Streams(object):
+
+    """ Independent random streams derived from a root seed.
+
+    :param seed: A root seed (an object with a stable repr)
+    :param rng: (random.Random) A class of streams
+
+    """
+
+    def __init__(self, seed, rng=None):
+        self.seed = seed
+        self.rng = rng or random.Random
+        self.streams = dict()
+
+    def get(self, key):
+        """ Get a stream by a key, e.g. (scheme, field's name).
+
+        :return random.Random:
+
+        """
+        try:
+            return self.streams[key]
+        except KeyError:
+            stream = self.streams[key] = self.rng(derive_seed(self.seed, key))
+            return stream
@@ -0,0 +1,90 @@
+""" Instrumentation of generation.
+
+mixer.stats
+~~~~~~~~~~~
+
+Stats are collected when a mixer has `stats` param: ::
+
+    from mixer.main import Mixer
+    from mixer.stats import Stats
+
+    stats = Stats()
+    mixer = Mixer(stats=stats)
+    mixer.cycle(100).blend(SomeScheme)
+    print(stats)
+
+Events of the stats:
+
+* `gen_value` -- generation of a field's value (related objects included);
+* `unique_retry` -- a unique value was generated again;
+* `fabric_hit`, `fabric_miss` -- a fabric was found in typemixer's cache or made;
+* `populate` -- creation of an object (field is None);
+* `middleware` -- middlewares of an object (field is None);
+* `postprocess` -- saving of objects (field is None).
+
+Without `stats` param generation isn't instrumented.
+
+:copyright: 2013 by Kirill Klenov.
+:license: BSD, see LICENSE for more details.
+
+"""
+from __future__ import absolute_import
+
+from collections import defaultdict
+
+
+def _new_record():
+    return [0, 0.0]
+
+
+class Stats(object):
+
+    """ Collect counters and timings of generation.
+
+    :param callback: A function which is called for each event with
+                     (scheme, field's name, event, seconds, count)
+
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.data = defaultdict(_new_record)
+
+    def __str__(self):
+        lines = ['%-40s %-14s %10s %10s' % ('scheme.field', 'event', 'count', 'ms')]
+        for scheme, field, event, count, seconds in self.report():
+            name = getattr(scheme, '__name__', scheme)
+            if field is not None:
+                name = '%s.%s' % (name, field)
+            lines.append('%-40s %-14s %10d %10.2f' % (name, event, count, seconds * 1000))
+        return '\n'.join(lines)
+
+    def add(self, scheme, field, event, seconds=0.0, count=1):
+        """ Record an event. """
+        record = self.data[scheme, field, event]
+        record[0] += count
+        record[1] += seconds
+        if self.callback:
+            self.callback(scheme, field, event, seconds, count)
+
+    def get(self, scheme, field, event):
+        """ Get counters of an event.
+
+        :return tuple: (count, seconds)
+
+        """
+        count, seconds = self.data.get((scheme, field, event), (0, 0.0))
+        return count, seconds
+
+    def report(self):
+        """ Get all records, the slowest first.
+
+        :return list: A list of (scheme, field, event, count, seconds)
+
+        """
+        rows = [key + tuple(record) for key, record in self.data.items()]
+        return sorted(rows, key=lambda row: row[4], reverse=True)
+
+    def reset(self):
+        """ Drop collected stats. """
+        self.data.clear()
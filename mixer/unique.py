@@ -0,0 +1,332 @@
+""" Tracking of generated unique values.
+
+mixer.unique
+~~~~~~~~~~~~
+
+A tracker remembers values of a unique field. :class:`ExactTracker` keeps
+the values themselves, :class:`BloomTracker` keeps a scalable Bloom filter,
+so its memory is bounded by a false-positive rate. False positives only make
+the generator skip a few fresh values.
+
+Trackers are set by `unique_tracker` param of a mixer: ::
+
+    from functools import partial
+    from mixer.main import Mixer
+    from mixer.unique import BloomTracker
+
+    mixer = Mixer(unique_tracker=partial(BloomTracker, error=0.0001))
+
+Any class with `__contains__`, `add`, `update` and `__len__` could be used
+as a tracker (the builtin `set` too).
+
+Unique fabrics don't repeat values by construction, so a value costs O(1)
+however many values are generated: integers are drawn from a random
+permutation of the fabric's range (:class:`Permutation`) and choices are
+drawn without replacement (:class:`Sample`). See :func:`make_unique_fabric`.
+
+:copyright: 2013 by Kirill Klenov.
+:license: BSD, see LICENSE for more details.
+
+"""
+from __future__ import absolute_import, division
+
+import hashlib
+import inspect
+import math
+from functools import partial
+
+from ._faker import faker, SMALLINT
+
+
+# Integer fabrics -> default ranges of values
+RANGES = {
+    faker.big_integer: (-9223372036854775808, 9223372036854775807),
+    faker.percent: (0, 100),
+    faker.positive_integer: (0, 2147483647),
+    faker.random_int: (0, 9999),
+    faker.small_integer: (-SMALLINT, SMALLINT),
+    faker.small_positive_integer: (0, SMALLINT),
+}
+
+
+class Exhausted(RuntimeError):
+
+    """ All unique values of a fabric are used. """
+
+    pass
+
+
+class ExactTracker(object):
+
+    """ Remember all values exactly.
+
+    Unhashable values (lists, dicts) are compared by their reprs.
+
+    """
+
+    def __init__(self):
+        self.values = set()
+        self.reprs = set()
+
+    def __contains__(self, value):
+        try:
+            return value in self.values
+        except TypeError:
+            return repr(value) in self.reprs
+
+    def __len__(self):
+        return len(self.values) + len(self.reprs)
+
+    def add(self, value):
+        """ Remember the value. """
+        try:
+            self.values.add(value)
+        except TypeError:
+            self.reprs.add(repr(value))
+
+    def update(self, other):
+        """ Merge values of other tracker (or an iterable). """
+        if isinstance(other, ExactTracker):
+            self.values |= other.values
+            self.reprs |= other.reprs
+            return
+
+        for value in other:
+            self.add(value)
+
+
+class _BloomFilter(object):
+
+    """ A Bloom filter with a fixed capacity. """
+
+    def __init__(self, capacity, error):
+        self.capacity = capacity
+        self.size = max(8, int(math.ceil(-capacity * math.log(error) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, hash1, hash2):
+        size = self.size
+        return [(hash1 + num * hash2) % size for num in range(self.hashes)]
+
+    def contains(self, hash1, hash2):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(hash1, hash2))
+
+    def add(self, hash1, hash2):
+        bits = self.bits
+        for pos in self.positions(hash1, hash2):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, other):
+        bits = int.from_bytes(self.bits, 'little') | int.from_bytes(other.bits, 'little')
+        self.bits = bytearray(bits.to_bytes(len(self.bits), 'little'))
+
+        # Values of the filters could intersect, so estimate the count by bits
+        ones = bin(bits).count('1')
+        if ones >= self.size:
+            self.count = self.capacity
+        else:
+            self.count = int(-self.size / self.hashes * math.log(1 - ones / self.size))
+
+
+class BloomTracker(object):
+
+    """ Remember values in a scalable Bloom filter.
+
+    When a filter is full, a filter with twice the capacity and half the
+    error rate is added, so the total false-positive rate stays below
+    `2 * error` for any number of values. A filter takes about
+    `1.44 * log2(1 / error)` bits per value (18 bits for 0.001).
+
+    Values are hashed by their reprs, so trackers of different processes
+    could be merged.
+
+    :param capacity: Number of values of the first filter
+    :param error: False-positive rate of the first filter
+
+    """
+
+    def __init__(self, capacity=10 ** 5, error=0.001):
+        self.capacity = capacity
+        self.error = error
+        self.filters = [_BloomFilter(capacity, error)]
+
+    def __contains__(self, value):
+        hash1, hash2 = self.hash(value)
+        return any(bloom.contains(hash1, hash2) for bloom in self.filters)
+
+    def __len__(self):
+        return sum(bloom.count for bloom in self.filters)
+
+    @staticmethod
+    def hash(value):
+        """ Get two independent hashes of the value.
+
+        :return tuple:
+
+        """
+        digest = hashlib.blake2b(repr(value).encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def add(self, value):
+        """ Remember the value. """
+        bloom = self.filters[-1]
+        if bloom.count >= bloom.capacity:
+            bloom = self.__grow()
+        bloom.add(*self.hash(value))
+
+    def update(self, other):
+        """ Merge values of other tracker (or an iterable).
+
+        Filters of trackers with the same capacity and error are merged
+        bitwise.
+
+        """
+        if not isinstance(other, BloomTracker):
+            for value in other:
+                self.add(value)
+            return
+
+        if (other.capacity, other.error) != (self.capacity, self.error):
+            raise ValueError('Bloom trackers with different capacity or error cannot be merged')
+
+        while len(self.filters) < len(other.filters):
+            self.__grow()
+
+        for bloom, other_bloom in zip(self.filters, other.filters):
+            bloom.update(other_bloom)
+
+    def __grow(self):
+        num = len(self.filters)
+        bloom = _BloomFilter(self.capacity * 2 ** num, self.error / 2 ** num)
+        self.filters.append(bloom)
+        return bloom
+
+
+class Permutation(object):
+
+    """ Draw integers from `low` to `high` (inclusive) in a random order.
+
+    An index is encrypted by a Feistel network with random keys. It's a
+    bijection on a power of two, so indexes out of the range are encrypted
+    again until they fit (less than 4 times on average).
+
+    """
+
+    rounds = 4
+
+    def __init__(self, low=0, high=9999):
+        self.low = low
+        self.size = high - low + 1
+        self.half = max(1, ((self.size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half) - 1
+        self.keys = [faker.random.getrandbits(self.half) for _ in range(self.rounds)]
+        self.index = 0
+        self.step = 1
+
+    def __call__(self):
+        if self.index >= self.size:
+            if self.step > 1:
+                raise Exhausted('All %s values of the shard are used (%s values in %s shards)' % (
+                    len(range(self.index % self.step, self.size, self.step)),
+                    self.size, self.step))
+            raise Exhausted('All %s values are used' % self.size)
+
+        value = self.encrypt(self.index)
+        while value >= self.size:
+            value = self.encrypt(value)
+
+        self.index += self.step
+        return self.low + value
+
+    def shard(self, index, shards):
+        """ Draw every `shards`-th index from `index`.
+
+        Shards of permutations with the same keys are disjoint.
+
+        """
+        self.index, self.step = index, shards
+
+    def encrypt(self, value):
+        """ Encrypt a number of `2 * half` bits. """
+        half, mask = self.half, self.mask
+        left, right = value >> half, value & mask
+        for key in self.keys:
+            left, right = right, left ^ ((right ^ key) * 0x9E3779B1 >> 7 & mask)
+        return left << half | right
+
+
+class Sample(object):
+
+    """ Draw elements in a random order without replacement. """
+
+    def __init__(self, elements=('a', 'b', 'c')):
+        self.elements = list(elements)
+        faker.random.shuffle(self.elements)
+
+    def __call__(self):
+        if not self.elements:
+            raise Exhausted('All elements are used')
+
+        return self.elements.pop()
+
+    def shard(self, index, shards):
+        """ Draw every `shards`-th element from `index`.
+
+        Shards of samples with the same order are disjoint.
+
+        """
+        self.elements = self.elements[index::shards]
+
+
+def make_unique_fabric(fabric):
+    """ Get a fabric which doesn't repeat values of `fabric`.
+
+    :return function: A fabric or None when `fabric` is unknown
+
+    """
+    func, args, kwargs = fabric, (), {}
+    if isinstance(fabric, partial):
+        func, args, kwargs = fabric.func, fabric.args, fabric.keywords
+
+    try:
+        if func == faker.random_element:
+            params = inspect.signature(func).bind(*args, **kwargs).arguments
+            return Sample(params.get('elements', ('a', 'b', 'c')))
+
+        if func not in RANGES:
+            return None
+
+        params = inspect.signature(func).bind(*args, **kwargs).arguments
+    except TypeError:
+        return None
+
+    if params.get('step', 1) != 1:
+        return None
+
+    min_value, max_value = RANGES[func]
+    return Permutation(params.get('min', min_value), params.get('max', max_value))
+
+
+def with_suffix(value, num, max_length=None):
+    """ Add a counter to a string value (before a domain of emails).
+
+    The value is cut so the result isn't longer than `max_length` (when
+    it's possible).
+
+    :return str:
+
+    """
+    suffix = str(num)
+    if '@' in value:
+        name, domain = value.rsplit('@', 1)
+        if max_length is not None:
+            name = name[:max(0, max_length - len(suffix) - len(domain) - 1)]
+        return '%s%s@%s' % (name, suffix, domain)
+
+    if max_length is not None:
+        value = value[:max(0, max_length - len(suffix))]
+    return value + suffix
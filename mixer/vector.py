@@ -0,0 +1,257 @@
+""" Vectorized generation with NumPy.
+
+Functions of the module generate a column of values at once from a NumPy
+random generator. They are used by :meth:`mixer.main.Mixer.blend_columns`
+instead of scalar fabrics and keep the value ranges of the fabrics.
+
+::
+
+    from mixer.main import mixer
+
+    columns = mixer.blend_columns(SomeScheme, 10 ** 6)
+
+:class:`VectorFactory` gives out the values one by one from blocks: ::
+
+    from mixer.main import Mixer
+    from mixer.vector import VectorFactory
+
+    mixer = Mixer(factory=VectorFactory)
+
+"""
+import datetime
+import decimal
+import sys
+import time
+from functools import partial
+
+import numpy as np
+
+from ._faker import faker, decimal_bounds, format_uuid4, SMALLINT
+from .factory import GenFactory
+from .pool import Pool
+
+
+def get_rng():
+    """ Get a NumPy random generator seeded from the faker's random state.
+
+    So `faker.seed_instance` makes columns reproducible.
+
+    :return numpy.random.Generator:
+
+    """
+    return np.random.default_rng(faker.random.getrandbits(64))
+
+
+def with_rng(vector, count, **kwargs):
+    """ Call a vector with a generator seeded from the current random state.
+
+    A generator is made for each column when the column is generated, so
+    columns of seeded fields draw from the fields' streams.
+
+    :return numpy.ndarray:
+
+    """
+    return vector(get_rng(), count, **kwargs)
+
+
+def integers(rng, count, min=0, max=9999):  # noqa
+    """ Get a column of integers from `min` to `max` (inclusive).
+
+    :return numpy.ndarray:
+
+    """
+    return rng.integers(min, max, count, dtype=np.int64, endpoint=True)
+
+
+def booleans(rng, count):
+    """ Get a column of booleans.
+
+    :return numpy.ndarray:
+
+    """
+    return rng.random(count) < 0.5
+
+
+def floats(rng, count):
+    """ Get a column of floats as `faker.pyfloat`.
+
+    Numbers have 1-14 fraction digits and up to 15 digits at all.
+
+    :return numpy.ndarray:
+
+    """
+    right = integers(rng, count, 1, sys.float_info.dig - 1)
+    left = sys.float_info.dig - right
+    number = np.floor(rng.random(count) * 10.0 ** left)
+    fraction = np.floor(rng.random(count) * 10.0 ** right) / 10.0 ** right
+    return np.where(booleans(rng, count), 1, -1) * (number + fraction)
+
+
+def decimals(rng, count, left_digits=None, right_digits=None, positive=False,
+             min_value=None, max_value=None):
+    """ Get a column of decimals as `faker.small_decimal`.
+
+    Numbers have `left_digits` integer and `right_digits` fraction digits
+    (1-10 if not set). Digits are drawn at once, only `Decimal` objects are
+    created one by one.
+
+    :return list:
+
+    """
+    left = integers(rng, count, 1, 10) if left_digits is None else np.full(count, left_digits)
+    right = integers(rng, count, 1, 10) if right_digits is None else np.full(count, right_digits)
+    if min_value is not None or max_value is not None:
+        right = right.tolist()
+        bounds = [
+            decimal_bounds(digits, places, positive, min_value, max_value)
+            for digits, places in zip(left.tolist(), right)]
+        return [
+            decimal.Decimal(low + min(int(u * (high - low + 1)), high - low)).scaleb(-r)
+            for u, r, (low, high) in zip(rng.random(count).tolist(), right, bounds)]
+
+    number = np.floor(rng.random(count) * 10.0 ** left).astype(np.int64)
+    fraction = np.floor(rng.random(count) * 10.0 ** right).astype(np.int64)
+    if positive:
+        fraction = np.where((number == 0) & (fraction == 0), 1, fraction)
+    signs = np.ones(count, np.int64) if positive else np.where(booleans(rng, count), 1, -1)
+    return [
+        decimal.Decimal(s * (n * 10 ** r + f)).scaleb(-r)
+        for s, n, f, r in zip(signs.tolist(), number.tolist(), fraction.tolist(), right.tolist())
+    ]
+
+
+def dates(rng, count):
+    """ Get a column of dates from 1970-01-01 to today.
+
+    :return numpy.ndarray: datetime64[D]
+
+    """
+    days = int(time.time() // 86400)
+    return np.datetime64(0, 'D') + integers(rng, count, 0, days)
+
+
+def datetimes(rng, count):
+    """ Get a column of datetimes from 1970-01-01 to now.
+
+    :return numpy.ndarray: datetime64[s]
+
+    """
+    return np.datetime64(0, 's') + integers(rng, count, 0, int(time.time()))
+
+
+def times(rng, count):
+    """ Get a column of times of a day.
+
+    :return numpy.ndarray: timedelta64[s] from midnight
+
+    """
+    return integers(rng, count, 0, 86399).astype('timedelta64[s]')
+
+
+def uuids(rng, count):
+    """ Get a column of UUID strings of version 4 as `faker.uuid`.
+
+    :return list:
+
+    """
+    data = rng.bytes(16 * count)
+    return [format_uuid4(data[pos:pos + 16]) for pos in range(0, 16 * count, 16)]
+
+
+# Scalar fabrics of :class:`mixer.factory.GenFactory` -> vectorized fabrics
+VECTORS = {
+    faker.big_integer: lambda rng, count: integers(
+        rng, count, -9223372036854775808, 9223372036854775807),
+    faker.date: dates,
+    faker.date_time: datetimes,
+    faker.random_date: dates,
+    faker.random_datetime: datetimes,
+    faker.random_float: floats,
+    faker.random_time: times,
+    faker.percent: lambda rng, count: integers(rng, count, 0, 100),
+    faker.positive_decimal: partial(decimals, positive=True),
+    faker.positive_integer: lambda rng, count: integers(rng, count, 0, 2147483647),
+    faker.pybool: booleans,
+    faker.pyfloat: floats,
+    faker.random_int: integers,
+    faker.small_decimal: decimals,
+    faker.small_integer: lambda rng, count: integers(rng, count, -SMALLINT, SMALLINT),
+    faker.small_positive_integer: lambda rng, count: integers(rng, count, 0, SMALLINT),
+    faker.time: times,
+    faker.uuid: uuids,
+}
+
+
+class Block(Pool):
+
+    """ Give out values of a vectorized fabric one by one.
+
+    A block of values is drawn at once, so a value costs about a list
+    index. Values of the block are converted to Python types.
+
+    :param vector: A function of :data:`VECTORS`
+    :param fabric: The scalar fabric (it's used for unique values)
+    :param size: (1024) Number of values in a block
+
+    """
+
+    def __init__(self, vector, fabric, size=1024):
+        super(Block, self).__init__(fabric, size=size)
+        self.vector = vector
+
+    def refill(self):
+        """ Draw a new block. """
+        values = self.vector(get_rng(), self.size)
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+
+            # Times are drawn as timedeltas from midnight
+            if values and isinstance(values[0], datetime.timedelta):
+                values = [(datetime.datetime.min + value).time() for value in values]
+
+        self.values = values
+        self.index = 0
+
+    def bind(self, **kwargs):
+        """ Get a block of the fabric with arguments.
+
+        :return Block:
+
+        """
+        return type(self)(
+            partial(self.vector, **kwargs), partial(self.fabric, **kwargs), self.size)
+
+
+class VectorFactory(GenFactory):
+
+    """ Draw numbers, booleans, decimals, dates and UUIDs by blocks from NumPy.
+
+    Fabrics of :data:`VECTORS` are replaced with :class:`Block`, the value
+    ranges are the same. Dates and times are `datetime` objects.
+
+    Mix the factory into a backend's factory to use it with the backend: ::
+
+        from mixer.backend.django import GenFactory, Mixer
+
+        class Factory(VectorFactory, GenFactory):
+            pass
+
+        mixer = Mixer(factory=Factory)
+
+    """
+
+    block_size = 1024
+
+    @classmethod
+    def get_fabric(cls, fcls, fname=None, fake=False):
+        """ Make a objects fabric based on class and name.
+
+        :return function:
+
+        """
+        fab = super(VectorFactory, cls).get_fabric(fcls, fname, fake)
+        vector = VECTORS.get(fab) if fab else None
+        if vector is None:
+            return fab
+
+        return Block(vector, fab, cls.block_size)
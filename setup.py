@@ -30,7 +30,7 @@ setup(
     packages=['mixer', 'mixer.backend'],
     include_package_data=True,
     install_requires=install_requires,
-    extras_require={'tests': tests_requires},
+    extras_require={'tests': tests_requires, 'numpy': ['numpy >= 1.17']},
 )
 
 # lint_ignore=F0401
@@ -42,9 +42,12 @@ def test_fields(mixer):
     assert isinstance(rabbit.opened_at, datetime.time)
     assert '@' in rabbit.email
     assert isinstance(rabbit.speed, decimal.Decimal)
+    assert abs(rabbit.speed) < 100
+    assert rabbit.speed.as_tuple().exponent == -1
     assert rabbit.custom
     assert rabbit.text
     assert len(rabbit.text) <= 512
+
     assert rabbit.picture.read() == b'pylama\n'
 
     assert rabbit.ip.count('.') == 3
@@ -60,6 +63,9 @@ def test_fields(mixer):
     rabbit = mixer.blend('rabbit')
     assert rabbit
 
+    rabbit = mixer.blend('django_app.rabbit', title=mixer.RANDOM)
+    assert len(rabbit.title) == 16
+
 
 def test_random_fields():
     mixer = Mixer(fake=False)
@@ -172,6 +178,70 @@ def test_many_to_many_random(mixer):
     assert Tag.objects.all().count() == 10
 
 
+def test_blend_many(mixer):
+    messages = mixer.blend_many('django_app.message', 5)
+    assert all(message.pk for message in messages)
+    assert Message.objects.count() == 5
+
+    tags = mixer.blend_many(Tag, 3, messages=messages, title=mixer.sequence('tag{0}'))
+    assert [tag.title for tag in tags] == ['tag0', 'tag1', 'tag2']
+    assert tags[2].messages.count() == 5
+
+
+def test_blend_bulk():
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    mixer = Mixer(commit='bulk')
+    with CaptureQueriesContext(connection) as queries:
+        messages = mixer.cycle(20).blend(Message)
+
+    assert all(message.pk and message.client.pk for message in messages)
+    assert Message.objects.count() == Client.objects.count() == 20
+    assert len(queries) < 10
+
+    # Parents which can't be inserted in bulk (custom save) are saved first
+    doors = mixer.cycle(5).blend(Door, owner=None)
+    assert Door.objects.filter(hole__owner__isnull=False).count() == 5
+    assert all(door.hole.owner.pk for door in doors)
+
+    tags = mixer.cycle(3).blend(Tag, messages=messages[:5])
+    assert all(tag.messages.count() == 5 for tag in tags)
+
+    number = mixer.blend('django_app.number', doors__size=42)
+    assert number.doors.get().size == 42
+
+    pointa = mixer.blend('django_app.pointa', other=mixer.RANDOM)
+    assert pointa.other.count() == 1
+
+
+def test_bulk_scope(mixer):
+    with mixer.bulk():
+        simple = mixer.blend(Simple)
+        assert not simple.pk
+        messages = mixer.cycle(5).blend(Message)
+        assert not Message.objects.exists()
+
+    assert simple.pk
+    assert Message.objects.count() == 5
+    assert [message.client.pk for message in messages] == list(
+        Message.objects.order_by('pk').values_list('client', flat=True))
+
+    with pytest.raises(RuntimeError):
+        with mixer.bulk():
+            mixer.blend(Simple)
+            raise RuntimeError('Stop')
+
+    assert Simple.objects.count() == 1
+
+
+def test_blend_many_parallel(mixer):
+    clients = mixer.cycle(6, workers=2, seed=42).blend(Client)
+    assert all(client.pk for client in clients)
+    assert len(set(client.city for client in clients)) == 6
+    assert Client.objects.count() == 6
+
+
 @pytest.mark.skip(reason='Not implemented')
 def test_many_to_many_select(mixer):
     mixer.cycle(5).blend('django_app.message')
@@ -266,6 +336,16 @@ def test_unique(mixer):
     for _ in range(100):
         mixer.blend(Client)
 
+    from mixer.backend.django import GenFactory
+
+    class CityFactory(GenFactory):
+        fakers = {('city', str): lambda: 'Lake %s' % ('x' * 20)}
+
+    mixer = Mixer(factory=CityFactory)
+    clients = mixer.cycle(12).blend(Client)
+    assert len(set(client.city for client in clients)) == 12
+    assert all(len(client.city) <= 20 for client in clients)
+
 
 def test_guard(mixer):
     r1 = mixer.guard(username='maxi').blend(Rabbit, username='maxi')
@@ -45,4 +45,101 @@ def test_faker():
 
     assert faker.pybytes()
 
+    assert len(faker.random_string()) == 20
+    assert faker.random_string(5000).isalpha()
+    assert faker.random_string() != faker.random_string()
+
     assert faker.date_time_this_month()
+
+
+def test_lazy_providers():
+    import pickle
+    import subprocess
+    import sys
+
+    from mixer._faker import MixerGenerator
+
+    code = 'import mixer.main; from mixer._faker import faker; print(faker.env.loaded)'
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.strip() == b'False'
+
+    faker = MixerGenerator()
+    name = faker.name
+    assert not faker.env.loaded
+    assert faker.json()
+    assert MixerGenerator().pybytes()
+    assert faker.name is name
+    assert name.__name__ == 'name'
+
+    assert name()
+    assert faker.env.loaded
+
+    faker.locale = 'ru'
+    assert not faker.env.loaded
+    assert faker.day_of_week() in {
+        "Воскресенье", "Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота"}
+
+    assert pickle.loads(pickle.dumps(name))()
+
+
+def test_uuid():
+    import uuid
+
+    from mixer._faker import faker
+
+    value = uuid.UUID(faker.uuid())
+    assert value.version == 4
+    assert value.variant == uuid.RFC_4122
+    assert len(set(faker.uuid() for _ in range(10000))) == 10000
+    assert uuid.UUID(faker.uuid(version=1)).version == 1
+
+    faker.seed_instance(42)
+    values = [faker.uuid() for _ in range(3)]
+    faker.seed_instance(42)
+    assert [faker.uuid() for _ in range(3)] == values
+
+
+def test_decimal():
+    from decimal import Decimal
+
+    import pytest
+
+    from mixer._faker import faker
+
+    value = faker.small_decimal(2, 1)
+    assert abs(value) < 100
+    assert value.as_tuple().exponent == -1
+    assert abs(faker.small_decimal(0, 3)) < 1
+    assert all(faker.positive_decimal(1, 1) > 0 for _ in range(100))
+    assert Decimal('1.5') <= faker.small_decimal(1, 2, min_value=1.5, max_value=2) <= 2
+    assert faker.small_decimal(right_digits=4, min_value=0) >= 0
+    assert faker.small_decimal(right_digits=4, max_value=0) <= 0
+
+    with pytest.raises(ValueError):
+        faker.small_decimal(1, 0, min_value=0.2, max_value=0.8)
+
+    faker.seed_instance(42)
+    values = [faker.small_decimal() for _ in range(3)]
+    faker.seed_instance(42)
+    assert [faker.small_decimal() for _ in range(3)] == values
+
+
+def test_random_bytes():
+    from mixer._faker import faker, BLOB_BUFFER
+
+    assert isinstance(faker.random_bytes(), bytes)
+    assert len(faker.random_bytes()) == 20
+    assert faker.random_bytes() != faker.random_bytes()
+    assert 5 <= len(faker.random_bytes((5, 10))) <= 10
+    assert len(faker.random_bytes(lambda rnd: 7)) == 7
+
+    blob = faker.random_bytes(10 ** 5, view=True)
+    assert isinstance(blob, memoryview)
+    assert blob.readonly
+    assert len(blob) == 10 ** 5
+    assert len(faker.random_bytes(BLOB_BUFFER + 1)) == BLOB_BUFFER + 1
+
+    faker.seed_instance(42)
+    values = [faker.random_bytes(size) for size in (20, 10 ** 4)]
+    faker.seed_instance(42)
+    assert [faker.random_bytes(size) for size in (20, 10 ** 4)] == values
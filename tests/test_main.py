@@ -22,6 +22,22 @@ class Test:
     scheme = dict
 
 
+class UniqueTypeMixer(TypeMixer):
+
+    """ Generate unique values for all fields. """
+
+    @staticmethod
+    def is_unique(field):
+        return True
+
+
+class UniqueMixer(Mixer):
+
+    """ Generate unique values for all fields. """
+
+    type_mixer_cls = UniqueTypeMixer
+
+
 def test_factory():
     """ Test base generator's factory. """
     from mixer.main import GenFactory
@@ -34,6 +50,49 @@ def test_factory():
     assert test() in (True, False)
 
 
+def test_factory_mro():
+    """ Test resolution of custom classes. """
+    from mixer import mix_types as t
+    from mixer.main import GenFactory
+
+    class Email(t.EmailString):
+        pass
+
+    class Login(Email):
+        pass
+
+    class Mixin(object):
+        pass
+
+    class Number(Mixin, int):
+        pass
+
+    assert GenFactory.get_fabric(Login) == GenFactory.generators[t.EmailString]
+    assert GenFactory.cls_to_simple(Login) is t.EmailString
+    assert GenFactory.cls_to_simple(Number) is int
+    assert GenFactory.get_fabric(Number, 'percent', fake=True) == GenFactory.fakers['percent', int]
+    assert Login in GenFactory.resolved
+
+    GenFactory.clear_cache()
+    assert Login not in GenFactory.resolved
+
+
+def test_string_fabric():
+    from mixer._faker import faker
+
+    fab = TypeMixer.make_string_fabric(faker.random_string, 8)
+    assert len(fab()) == 8
+    assert len(TypeMixer.make_string_fabric(faker.random_string, 100)()) == 20
+    assert TypeMixer.make_string_fabric(faker.random_string) == faker.random_string
+
+    fab = TypeMixer.make_string_fabric(faker.text, 30)
+    assert fab.keywords == dict(max_nb_chars=30)
+    assert all(len(fab()) <= 30 for _ in range(10))
+
+    fab = TypeMixer.make_string_fabric(faker.email, 5)
+    assert len(fab()) == 5
+
+
 def test_typemixer_meta():
     """ Tests that typemixer is a singleton for current class. """
     mixer1 = TypeMixer(Test)
@@ -65,6 +124,27 @@ def test_typemixer():
     assert test.unknown == '?'
 
 
+def test_typemixer_plan():
+
+    class Scheme:
+        id = int
+        name = str
+        prop = Test
+
+    mixer = TypeMixer(Scheme)
+    plan = mixer.get_plan({'name': 'John'})
+    assert mixer.get_plan({'name': 'Mike'}) is plan
+    assert mixer.get_plan({'prop__two': 2}) is not plan
+
+    test = mixer.blend(name='John', prop__two=2)
+    assert test.name == 'John'
+    assert test.prop.two == 2
+
+    mixer.register('id', lambda: 42)
+    assert mixer.get_plan({'name': 'John'}) is not plan
+    assert mixer.blend(name='John').id == 42
+
+
 def test_fake():
     from mixer.main import mixer
 
@@ -161,6 +241,191 @@ def test_mixer_cycle():
     assert test[2].name == 'lama2'
 
 
+def test_mixer_blend_many():
+
+    class BatchMixer(Mixer):
+
+        saved = []
+
+        def postprocess_many(self, targets):
+            self.saved.append(len(targets))
+            return super(BatchMixer, self).postprocess_many(targets)
+
+    mixer = BatchMixer(batch_size=4)
+    test = mixer.blend_many(Test, 10, name=mixer.sequence('lama{0}'), one=1)
+    assert len(test) == 10
+    assert test[9].name == 'lama9'
+    assert test[0].one == 1
+    assert mixer.saved == [4, 4, 2]
+
+    test = mixer.cycle(2).blend(Test, count=10, seed='abc', lazy=True)
+    assert [(t.count, t.seed, t.lazy) for t in test] == [(10, 'abc', True)] * 2
+
+    def fail():
+        raise ValueError()
+
+    mixer = Mixer(silence=True, batch_size=2)
+    assert mixer.cycle(3).blend(Test, one=fail) == [None] * 3
+
+
+def test_mixer_stream():
+    from itertools import islice
+
+    mixer = Mixer()
+    stream = mixer.stream(Test, name=mixer.sequence('lama{0}'), title=mixer.MIX.name)
+    test = list(islice(stream, 250))
+    assert test[249].name == 'lama249'
+    assert test[249].title == 'lama249'
+
+    mixer = Mixer(batch_size=10)
+    batches = list(mixer.batches(Test, 25, chunked=True))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[0][0].chunked is True
+
+
+def test_mixer_ablend():
+    import asyncio
+
+    class BatchMixer(Mixer):
+        saved = []
+
+        def postprocess_many(self, targets):
+            self.saved.append(len(targets))
+            return targets
+
+    mixer = BatchMixer(batch_size=4, concurrency=2)
+    test = asyncio.run(mixer.ablend_many(Test, 10, name=mixer.sequence('lama{0}')))
+    assert [t.name for t in test] == ['lama%s' % num for num in range(10)]
+    assert sorted(mixer.saved) == [2, 4, 4]
+
+    test = asyncio.run(mixer.ablend(Test, name='lama'))
+    assert test.name == 'lama'
+
+
+def test_mixer_parallel():
+    mixer = Mixer()
+    test = mixer.cycle(6, workers=2, seed=42).blend(Test, name=mixer.sequence('lama{0}'))
+    assert [t.name for t in test] == ['lama%s' % num for num in range(6)]
+
+    test2 = mixer.cycle(6, workers=3, seed=42).blend(Test, name=mixer.sequence('lama{0}'))
+    assert [t.title for t in test2] == [t.title for t in test]
+    assert [t.price for t in test2] == [t.price for t in test]
+
+    test3 = mixer.cycle(6, seed=42).blend(Test, name=mixer.sequence('lama{0}'))
+    assert [t.title for t in test3] == [t.title for t in test]
+
+    # Seeded chunks don't reseed random states of the caller
+    rnd = mixer.faker.random
+    mixer.cycle(6, seed=42).blend(Test)
+    values = [mixer.blend(Test).one for _ in range(20)]
+    mixer.cycle(6, seed=42).blend(Test)
+    assert [mixer.blend(Test).one for _ in range(20)] != values
+    assert mixer.faker.random is rnd
+
+    mixer = UniqueMixer()
+    test = mixer.cycle(64, workers=2, seed=42).blend(Test)
+    assert len(set(t.one for t in test)) == 64
+    assert len(set(t.body for t in test)) == 64
+
+    # Unique values of the workers are merged
+    state = mixer.get_typemixer(Test).dump_state()
+    assert all(t.one in state['unique']['one'] for t in test)
+
+    mixer = Mixer()
+    mixer.register(Test, title=lambda: 'title')
+    mixer.middleware(Test)(_price_middleware)
+    test = mixer.cycle(4, workers=2, seed=42).blend(Test)
+    assert [(t.title, t.price) for t in test] == [('title', 0)] * 4
+
+    mixer = Mixer(silence=True)
+    mixer.register(Test, one=_fail)
+    test = mixer.cycle(4, workers=2).blend(Test)
+    assert test == [None] * 4
+
+    mixer = Mixer()
+    mixer.register(Test, one=_fail)
+    with pytest.raises(ValueError):
+        mixer.cycle(4, workers=2).blend(Test)
+
+
+def test_mixer_pickle():
+    import pickle
+
+    mixer = Mixer()
+    mixer.register(Test, title=_title)
+    mixer.middleware(Test)(_price_middleware)
+
+    mixer = pickle.loads(pickle.dumps(mixer))
+    test = mixer.blend(Test)
+    assert (test.title, test.price) == ('title', 0)
+
+    mixer = UniqueMixer()
+    test = mixer.blend(Test)
+
+    mixer = pickle.loads(pickle.dumps(mixer))
+    assert test.one in mixer.get_typemixer(Test).dump_state()['unique']['one']
+
+
+def _title():
+    return 'title'
+
+
+def _price_middleware(target):
+    target.price = 0
+    return target
+
+
+def _fail():
+    return 1 / 0
+
+
+def test_mixer_cache():
+    import gc
+    import weakref
+
+    mixer = Mixer()
+    mixer.blend(Test)
+    assert len(mixer.type_mixers) == 1
+
+    # Typemixers are freed with the mixer
+    type_mixer = weakref.ref(mixer.get_typemixer(Test))
+    mixer = weakref.ref(mixer)
+    gc.collect()
+    assert mixer() is None
+    assert type_mixer() is None
+
+    class Scheme:
+        name = str
+
+    mixer = Mixer(cache_size=1)
+    mixer.blend(Scheme)
+    mixer.blend(Test)
+    assert len(mixer.type_mixers) == 1
+
+    scheme = weakref.ref(Scheme)
+    del Scheme
+    gc.collect()
+    assert scheme() is None
+
+    mixer.clear_cache()
+    assert not len(mixer.type_mixers)
+
+    # Typemixers without a mixer
+    class Other:
+        name = str
+
+    TypeMixer.set_cache_size(2)
+    try:
+        TypeMixer(Test)
+        TypeMixer(Person)
+        TypeMixer(Test)
+        TypeMixer(Other)
+        assert len(TypeMixer.mixers) == 2
+        assert [key[1] for key, _ in TypeMixer.mixers.items()] == [Test, Other]
+    finally:
+        TypeMixer.set_cache_size(None)
+
+
 def test_mixer_default():
     from mixer.main import mixer
 
@@ -261,6 +526,72 @@ def test_locale():
     assert mixer.faker.locale == 'ru_RU'
 
 
+class Person:
+
+    """ Model scheme with localized fields. """
+
+    first_name = str
+    last_name = str
+
+
+def test_locale_threads():
+    import re
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    alphabets = {
+        'en_US': re.compile(r"^[A-Za-z' -]+$"),
+        'ru_RU': re.compile(r'^[А-Яа-яЁё -]+$'),
+        'el_GR': re.compile(r'^[\u0370-\u03ff\u1f00-\u1fff -]+$'),
+        'hy_AM': re.compile(r'^[\u0530-\u058f -]+$'),
+    }
+    barrier = threading.Barrier(8, timeout=30)
+    mixer = Mixer()
+
+    def blend(num):
+        locale = list(alphabets)[num % len(alphabets)]
+        barrier.wait()
+        with mixer.ctx(locale=locale):
+            mixer.faker.seed_instance(num)
+            people = mixer.cycle(50).blend(Person)
+            return locale, [(p.first_name, p.last_name) for p in people]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(blend, range(32)))
+
+    for num, (locale, names) in enumerate(results):
+        assert mixer.faker.locale == 'en_US'
+        assert all(alphabets[locale].match(name) for pair in names for name in pair)
+
+        # Random states of threads are independent
+        with mixer.ctx(locale=locale):
+            mixer.faker.seed_instance(num)
+            people = mixer.cycle(50).blend(Person)
+        assert names == [(p.first_name, p.last_name) for p in people]
+
+
+def test_faker_seed():
+    import threading
+
+    mixer = Mixer()
+    mixer.faker.seed(42)
+    people = [(p.first_name, p.last_name) for p in mixer.cycle(5).blend(Person)]
+    mixer.faker.seed(42)
+    assert people == [(p.first_name, p.last_name) for p in mixer.cycle(5).blend(Person)]
+
+    # The default locale of the mixer is used in other threads
+    mixer = Mixer(locale='ru')
+    names = []
+    thread = threading.Thread(target=lambda: names.append(mixer.blend(Person).first_name))
+    thread.start()
+    thread.join()
+    assert mixer.faker.locale == 'ru_RU'
+    assert all(ord(char) > 127 for char in names[0] if char.isalpha())
+
+    Mixer(locale='en_US')
+    assert mixer.faker.locale == 'en_US'
+
+
 def test_silence():
     mixer = Mixer()
 
@@ -0,0 +1,160 @@
+""" Test Markov chains of words. """
+import pickle
+
+import pytest
+
+from mixer import mix_types as t
+from mixer._faker import faker
+from mixer.factory import GenFactory
+from mixer.main import Mixer, TypeMixer
+from mixer.markov import (
+    CompactDB, MarkovChain, MarkovText, MarkovTrainer, StringContinuationImpossibleError,
+    load_chain, train_files)
+
+TEXT = """
+Mixer generates objects. Mixer generates values of fields.
+Faker generates names and texts. Mixer uses Faker for names.
+"""
+
+
+def test_compact_db():
+    db = {('',): {'a': 1.0}, ('a',): {'b': 0.75, '': 0.25}, ('a', 'b'): {'': 1.0}}
+    compact = CompactDB.from_dict(db)
+    assert len(compact) == 3
+    assert sorted(compact) == sorted(db)
+    assert ('a', 'b') in compact
+    assert ('b',) not in compact
+    assert ('c',) not in compact
+    assert compact[('a',)] == {'b': 0.75, '': 0.25}
+    assert compact.word(compact.index('b')) == 'b'
+    assert compact.index('c') is None
+    assert compact.to_dict() == db
+
+    with pytest.raises(ValueError):
+        CompactDB(b'\0' * 64)
+
+
+def test_markov_chain(tmpdir):
+    path = str(tmpdir.join('markov.db'))
+    chain = MarkovChain(path)
+    assert chain.generateString() == ''
+
+    chain.generateDatabase(TEXT)
+    sentence = chain.generateString()
+    assert sentence.split()[0] in ('Mixer', 'Faker')
+    assert chain.generateStringWithSeed('Faker uses').startswith('Faker uses ')
+
+    with pytest.raises(StringContinuationImpossibleError):
+        chain.generateStringWithSeed('Unknown')
+
+    assert chain.dumpdb()
+    loaded = MarkovChain(path)
+    assert loaded.db.path == path
+    assert loaded.db.to_dict() == chain.db.to_dict()
+    assert pickle.loads(pickle.dumps(loaded.db)).path == path
+
+    faker.seed_instance(42)
+    sentences = [loaded.generateString() for _ in range(5)]
+    faker.seed_instance(42)
+    assert [chain.generateString() for _ in range(5)] == sentences
+
+
+def test_sampling(tmpdir):
+    db = {('',): {'a': 0.25, 'b': 0.0, 'c': 0.75}, ('a',): {'': 1.0}, ('c',): {'': 1.0}}
+    compact = CompactDB.from_dict(db)
+    state = compact.find(('',))
+    assert compact.word(compact.choose(state, 0.0)) == 'c'
+    assert compact.word(compact.choose(state, 0.74)) == 'c'
+    assert compact.word(compact.choose(state, 0.76)) == 'a'
+    assert compact.word(compact.choose(state, 0.9999999)) == 'a'
+
+    chain = MarkovChain(str(tmpdir.join('markov.db')))
+    chain.db = compact
+    sentences = chain.generateStrings(1000)
+    assert set(sentences) == {'a', 'c'}
+    assert 150 < sentences.count('a') < 350
+
+
+def test_trainer(tmpdir):
+    trainer = MarkovTrainer()
+    trainer.feed(TEXT)
+    compact = CompactDB(trainer.build())
+    assert compact[('Mixer',)] == pytest.approx({'generates': 2 / 3, 'uses': 1 / 3})
+    assert compact[('Mixer', 'generates')] == {'objects': 0.5, 'values': 0.5}
+
+    # Sentences are continued by the next chunks
+    chunks = MarkovTrainer()
+    chunks.feed(iter([TEXT[pos:pos + 7] for pos in range(0, len(TEXT), 7)]))
+    assert chunks.build() == trainer.build()
+
+    rare = CompactDB(trainer.build(min_count=2))
+    assert rare[('Mixer',)] == {'generates': 1.0}
+    assert ('Faker',) not in rare
+
+    small = MarkovTrainer(max_transitions=10)
+    small.feed(TEXT)
+    assert len(small.counts) <= 10
+    small.prune(100)
+    assert not small.counts
+
+    paths = []
+    for num, text in enumerate(TEXT.strip().split('\n')):
+        paths.append(str(tmpdir.join('part%s.txt' % num)))
+        with open(paths[-1], 'w') as source:
+            source.write(text)
+
+    merged = MarkovTrainer.from_db(CompactDB(train_files(paths, workers=2).build()))
+    assert CompactDB(merged.build()).to_dict() == compact.to_dict()
+
+
+def test_convert_pickle(tmpdir):
+    path = str(tmpdir.join('markov.pickle'))
+    db = {('',): {'Mixer': 1.0}, ('Mixer',): {'mixes': 1.0}, ('mixes',): {'': 1.0}}
+    with open(path, 'wb') as dbfile:
+        pickle.dump(db, dbfile)
+
+    chain = MarkovChain(path)
+    assert chain.generateString() == 'Mixer mixes'
+
+    assert chain.dumpdb()
+    assert MarkovChain(path).db.path == path
+    assert MarkovChain(path).generateString() == 'Mixer mixes'
+
+
+class Article:
+
+    """ Model scheme with texts. """
+
+    title = str
+    body = t.Text
+
+
+def test_markov_text(tmpdir):
+    path = str(tmpdir.join('markov.db'))
+    chain = MarkovChain(path)
+    chain.generateDatabase(TEXT)
+    chain.dumpdb()
+    assert load_chain(path) is load_chain(path)
+
+    fabric = MarkovText(path, max_nb_chars=50, size=10, reuse=2)
+    texts = [fabric() for _ in range(30)]
+    assert all(0 < len(text) <= 50 for text in texts)
+    assert all(text.endswith('.') for text in texts)
+    assert len(set(texts)) > 1
+    assert len(fabric.sentence()) <= 50
+
+    short = TypeMixer.make_string_fabric(fabric, 10)
+    assert isinstance(short, MarkovText)
+    assert all(len(short()) <= 10 for _ in range(30))
+
+    body = MarkovText(path, size=100)
+
+    class Factory(GenFactory):
+        generators = {t.Text: body}
+
+    mixer = Mixer(factory=Factory)
+    articles = mixer.cycle(5).blend(Article)
+    assert all(article.body.split('.')[0] + '.' in body.values for article in articles)
+
+    with pytest.raises(ValueError):
+        MarkovText(str(tmpdir.join('empty.db')))()
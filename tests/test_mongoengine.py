@@ -95,6 +95,24 @@ def test_relation():
     assert bookmark.bookmark
 
 
+def test_blend_many():
+    from mixer.backend.mongoengine import Mixer
+
+    connect('mixer', host='mongomock://localhost')
+    try:
+        mixer = Mixer()
+        users = mixer.blend_many(User, 3)
+        assert all(user.pk for user in users)
+        assert User.objects.count() == 3
+
+        users[0].first_name = 'John'
+        users[0].save()
+        assert User.objects.count() == 3
+        assert User.objects.get(pk=users[0].pk).first_name == 'John'
+    finally:
+        disconnect()
+
+
 def test_embedded_document_list_field():
     from mixer.backend.mongoengine import Mixer
 
@@ -27,8 +27,17 @@ class Pet(Model):
         database = db
 
 
+class Attachment(Model):
+    name = CharField()
+    data = BlobField()
+
+    class Meta:
+        database = db
+
+
 Person.create_table()
 Pet.create_table()
+Attachment.create_table()
 
 
 @pytest.fixture
@@ -60,6 +69,16 @@ def test_mixer(mixer):
         assert person.id
 
 
+def test_blend_many(mixer):
+    persons = mixer.blend_many(Person, 3, name=mixer.sequence('person{0}'))
+    assert all(person.id for person in persons)
+    assert Person.select().count() == 3
+
+    pets = mixer.blend_many(Pet, 3, owner=(p for p in persons))
+    assert all(pet.id for pet in pets)
+    assert [pet.owner.name for pet in pets] == ['person0', 'person1', 'person2']
+
+
 def test_guard(mixer):
     person = mixer.blend(Person)
     person2 = mixer.guard(Person.name == person.name).blend(Person)
@@ -78,3 +97,12 @@ def test_select(mixer):
     person = mixer.blend(Person)
     pet = mixer.blend(Pet, owner=mixer.SELECT)
     assert person == pet.owner
+
+
+def test_blob(mixer):
+    attachment = mixer.blend(Attachment)
+    assert isinstance(attachment.data, bytes)
+    assert Attachment.get_by_id(attachment.id).data == attachment.data
+
+    attachment = mixer.blend(Attachment, data__size=(1000, 2000))
+    assert 1000 <= len(attachment.data) <= 2000
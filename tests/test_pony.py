@@ -90,3 +90,6 @@ def test_mixer():
         with mixer.ctx(commit=True):
             order = mixer.blend(Order)
             assert order.id
+
+            orders = mixer.blend_many(Order, 3)
+            assert all(order.id for order in orders)
@@ -0,0 +1,33 @@
+""" Test pools of pre-generated values. """
+from functools import partial
+
+from mixer.main import Mixer
+from mixer.pool import Pool
+
+from .test_main import Test, UniqueMixer
+
+
+def test_pool():
+    values = iter(range(100))
+    pool = Pool(lambda: next(values), size=4, reuse=2)
+    test = [pool() for _ in range(8)]
+    assert sorted(test[:4]) == sorted(test[4:]) == [0, 1, 2, 3]
+    assert pool() == 4
+
+    pool.clear()
+    assert pool() == 8
+
+
+def test_mixer_pools():
+    mixer = Mixer(pools={('name', str): partial(Pool, size=10, reuse=5)})
+    test = mixer.cycle(50).blend(Test)
+    assert len(set(t.name for t in test)) <= 10
+
+    type_mixer = mixer.get_typemixer(Test)
+    assert isinstance(type_mixer.get_fabric(type_mixer._TypeMixer__fields['name'], 'name'), Pool) # noqa
+
+    # Pools aren't used for unique fields
+    mixer = UniqueMixer(pools={('title', None): partial(Pool, size=2, reuse=100)})
+    test = mixer.cycle(10).blend(Test)
+    assert len(set(t.title for t in test)) == 10
+    assert not any(t.title[-1].isdigit() for t in test)
@@ -0,0 +1,95 @@
+""" Test seedable random streams. """
+import datetime
+import random
+from decimal import Decimal
+
+from mixer.main import Mixer
+from mixer.rng import Streams, derive_seed
+
+from .test_main import Test
+
+
+class Extended(Test):
+
+    """ Model scheme with an extra field. """
+
+    extra = float
+
+
+def values(objects, fields=('one', 'two', 'name', 'title', 'price', 'parts')):
+    return [tuple(getattr(obj, name) for name in fields) for obj in objects]
+
+
+def test_streams():
+    streams = Streams(42)
+    assert streams.get((Test, 'one')) is streams.get((Test, 'one'))
+    assert streams.get((Test, 'one')).random() != streams.get((Test, 'two')).random()
+    assert derive_seed(42, (Test, 'one')) == derive_seed(42, (Test, 'one'))
+    assert derive_seed(42, (Test, 'one')) != derive_seed(43, (Test, 'one'))
+
+    class Engine(random.Random):
+        pass
+
+    streams = Streams(42, Engine)
+    assert isinstance(streams.get('key'), Engine)
+
+
+def test_mixer_seed():
+    test = Mixer(seed=42).cycle(5).blend(Test)
+    assert values(Mixer(seed=42).cycle(5).blend(Test)) == values(test)
+    assert values(Mixer(seed=43).cycle(5).blend(Test)) != values(test)
+
+    # Other fields and schemes don't change values of a field
+    mixer = Mixer(seed=42)
+    extended = []
+    for _ in range(5):
+        mixer.blend(Test)
+        extended.append(mixer.blend(Extended))
+    assert values(extended) == values(Mixer(seed=42).cycle(5).blend(Extended))
+    assert [t.one for t in extended] != [t.one for t in test]
+
+    mixer = Mixer(seed=42)
+    assert [t.one for t in mixer.cycle(5).blend(Test, name='John')] == [t.one for t in test]
+
+    # Generation continues streams
+    mixer = Mixer(seed=42)
+    first = mixer.cycle(5).blend(Test)
+    assert values(mixer.cycle(5).blend(Test)) != values(first)
+
+    mixer = Mixer(seed=42, rng=random.Random)
+    assert values(mixer.cycle(5).blend(Test)) == values(test)
+
+
+def test_mixer_seed_chunks():
+    test = Mixer().cycle(6, seed=42).blend(Test)
+    assert values(Mixer().cycle(6, workers=2, seed=42).blend(Test)) == values(test)
+
+    mixer = Mixer(seed=7)
+    test = mixer.cycle(6, workers=2).blend(Test)
+    assert values(Mixer(seed=7).cycle(6, workers=2).blend(Test)) == values(test)
+    assert values(mixer.cycle(6, workers=2).blend(Test)) != values(test)
+    assert mixer.params['seed'] == 7
+
+
+class Simple:
+
+    """ Model scheme with simple types. """
+
+    number = float
+    day = datetime.date
+    moment = datetime.datetime
+    clock = datetime.time
+    price = Decimal
+
+
+def test_simple_types():
+    simple = Mixer(seed=42).blend(Simple)
+    assert isinstance(simple.number, float)
+    assert datetime.date.fromisoformat(simple.day) <= datetime.date.today()
+    assert datetime.datetime(1970, 1, 1) <= simple.moment <= datetime.datetime.now()
+    assert datetime.time.fromisoformat(simple.clock)
+    assert isinstance(simple.price, Decimal)
+
+    other = Mixer(seed=42).blend(Simple)
+    assert (other.number, other.day, other.moment, other.clock, other.price) == (
+        simple.number, simple.day, simple.moment, simple.clock, simple.price)
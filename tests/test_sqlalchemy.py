@@ -147,6 +147,54 @@ def test_cycle(session):
     assert users[1].profile.name == 'second'
 
 
+def test_blend_many(session):
+    from mixer.backend.sqlalchemy import Mixer
+
+    mixer = Mixer(session=session, commit=True)
+    profiles = mixer.blend_many(Profile, 3, name=mixer.sequence('profile{0}'))
+    assert all(profile.id for profile in profiles)
+
+    users = mixer.blend_many(User, 3, profile=(p for p in profiles))
+    assert [user.profile.name for user in users] == ['profile0', 'profile1', 'profile2']
+    assert all(user.id for user in users)
+
+
+def test_blend_many_parallel(session):
+    from mixer.backend.sqlalchemy import Mixer
+
+    mixer = Mixer(session=session, commit=True)
+    profiles = mixer.cycle(4, workers=2).blend(Profile, name=mixer.sequence('profile{0}'))
+    assert [profile.name for profile in profiles] == ['profile0', 'profile1', 'profile2', 'profile3']
+    assert all(profile.id for profile in profiles)
+
+
+def test_ablend_many():
+    import asyncio
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from mixer.backend.sqlalchemy import Mixer
+
+    async def blend():
+        engine = create_async_engine('sqlite+aiosqlite://')
+        async with engine.begin() as conn:
+            await conn.run_sync(BASE.metadata.create_all)
+
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                mixer = Mixer(session=session, batch_size=2, concurrency=2)
+                profiles = await mixer.ablend_many(
+                    Profile, 5, name=mixer.sequence('profile{0}'))
+                user = await mixer.ablend(User, profile__name='lama')
+                return profiles, user
+        finally:
+            await engine.dispose()
+
+    profiles, user = asyncio.run(blend())
+    assert [profile.name for profile in profiles] == ['profile%s' % num for num in range(5)]
+    assert all(profile.id for profile in profiles)
+    assert user.id and user.profile.id
+    assert user.profile.name == 'lama'
+
+
 def test_select(session):
     from mixer.backend.sqlalchemy import Mixer
 
@@ -0,0 +1,62 @@
+""" Test instrumentation of generation. """
+from mixer.main import Mixer
+from mixer.stats import Stats
+
+from .test_main import Test, UniqueMixer
+
+
+class Parent:
+
+    """ Model scheme with a relation. """
+
+    name = str
+    test = Test
+
+
+def test_stats():
+    events = []
+    stats = Stats(callback=lambda *args: events.append(args))
+    mixer = Mixer(stats=stats)
+    mixer.middleware(Test)(lambda target: target)
+
+    mixer.cycle(3).blend(Test)
+    assert stats.get(Test, 'name', 'gen_value')[0] == 3
+    assert stats.get(Test, 'name', 'fabric_miss')[0] == 1
+    assert stats.get(Test, None, 'populate')[0] == 3
+    assert stats.get(Test, None, 'middleware')[0] == 3
+    assert stats.get(Test, None, 'postprocess')[0] == 1
+    assert (Test, 'name', 'gen_value') in [event[:3] for event in events]
+
+    mixer.blend(Parent)
+    count, seconds = stats.get(Parent, 'test', 'gen_value')
+    assert count == 1
+    assert seconds >= stats.get(Test, None, 'populate')[1] / 3
+
+    rows = stats.report()
+    assert rows[0][4] == max(row[4] for row in rows)
+    assert 'Test.name' in str(stats)
+
+    stats.reset()
+    assert not stats.report()
+
+
+def test_stats_unique_retry():
+    stats = Stats()
+    mixer = UniqueMixer(stats=stats)
+    values = iter([1, 1, 2])
+    mixer.register(Test, one=lambda: next(values))
+    mixer.cycle(2).blend(Test)
+    assert stats.get(Test, 'one', 'unique_retry')[0] == 1
+
+
+def test_stats_off():
+    mixer = Mixer()
+    mixer.blend(Test)
+
+    stats = Stats()
+    with mixer.ctx(stats=stats):
+        mixer.blend(Test)
+    mixer.blend(Test)
+
+    assert stats.get(Test, 'name', 'gen_value')[0] == 1
+    assert mixer.get_typemixer(Test).get_stats() is None
@@ -0,0 +1,195 @@
+""" Test tracking of unique values. """
+import pickle
+from functools import partial
+
+import pytest
+
+from mixer import mix_types as t
+from mixer._faker import faker
+from mixer.factory import GenFactory
+from mixer.unique import (
+    BloomTracker, ExactTracker, Permutation, Sample, make_unique_fabric, with_suffix)
+
+from .test_main import Test, UniqueMixer
+
+
+def test_exact_tracker():
+    tracker = ExactTracker()
+    tracker.add(1)
+    tracker.add([1, 2])
+    assert 1 in tracker
+    assert [1, 2] in tracker
+    assert [2, 1] not in tracker
+    assert len(tracker) == 2
+
+    other = ExactTracker()
+    other.add(2)
+    tracker.update(other)
+    tracker.update([3])
+    assert 2 in tracker
+    assert 3 in tracker
+
+
+def test_bloom_tracker():
+    tracker = BloomTracker(capacity=100, error=0.01)
+    for num in range(1000):
+        tracker.add('user%s' % num)
+
+    assert all('user%s' % num in tracker for num in range(1000))
+    assert len(tracker.filters) == 4
+    assert len(tracker) == 1000
+
+    misses = sum('guest%s' % num in tracker for num in range(10000))
+    assert misses < 10000 * 0.02
+
+    other = BloomTracker(capacity=100, error=0.01)
+    other.add('guest')
+    other.update(pickle.loads(pickle.dumps(tracker)))
+    assert 'guest' in other
+    assert all('user%s' % num in other for num in range(1000))
+
+    with pytest.raises(ValueError):
+        other.update(BloomTracker())
+
+
+def test_mixer_unique_tracker():
+    mixer = UniqueMixer(unique_tracker=BloomTracker)
+    test = mixer.cycle(100).blend(Test)
+    assert len(set(t.one for t in test)) == 100
+
+    tracker = mixer.get_typemixer(Test).dump_state()['unique']['one']
+    assert isinstance(tracker, BloomTracker)
+    assert all(t.one in tracker for t in test)
+
+    # Unhashable values are tracked too
+    mixer = UniqueMixer()
+    test = mixer.blend(Test)
+    assert isinstance(test.choices, list)
+    assert test.choices in mixer.get_typemixer(Test).dump_state()['unique']['choices']
+
+
+def test_reset_unique():
+    mixer = UniqueMixer()
+    mixer.register(Test, one=lambda: 1)
+
+    test = mixer.blend(Test)
+    assert test.one == 1
+
+    with pytest.raises(RuntimeError):
+        mixer.blend(Test)
+
+    with mixer.unique_scope():
+        test = mixer.blend(Test)
+        assert test.one == 1
+
+        with pytest.raises(RuntimeError):
+            mixer.blend(Test)
+
+    with pytest.raises(RuntimeError):
+        mixer.blend(Test)
+
+    mixer.reset_unique(Test)
+    test = mixer.blend(Test)
+    assert test.one == 1
+
+    mixer.reset_unique()
+    assert not mixer.get_typemixer(Test).dump_state()['unique']
+
+
+class Small:
+
+    """ Model scheme with small spaces of values. """
+
+    number = t.PositiveSmallInteger
+    genre = str
+    email = t.EmailString
+
+
+def test_permutation():
+    permutation = Permutation(-5, 94)
+    values = [permutation() for _ in range(100)]
+    assert sorted(values) == list(range(-5, 95))
+    assert values != sorted(values)
+
+    with pytest.raises(RuntimeError):
+        permutation()
+
+    # Shards of permutations with the same keys are disjoint
+    shards = []
+    for index in range(3):
+        faker.seed_instance(42)
+        shards.append(Permutation(0, 100))
+        shards[-1].shard(index, 3)
+    values = [[shard() for _ in range(34 - (index == 2))] for index, shard in enumerate(shards)]
+    assert sorted(sum(values, [])) == list(range(101))
+
+    with pytest.raises(RuntimeError, match='34 values of the shard'):
+        shards[0]()
+
+    fabric = make_unique_fabric(partial(faker.random_int, 5, max=7))
+    assert sorted(fabric() for _ in range(3)) == [5, 6, 7]
+    assert make_unique_fabric(faker.small_positive_integer).size == 32768
+    assert make_unique_fabric(partial(faker.random_int, 0, 10, 2)) is None
+    assert make_unique_fabric(faker.pystr) is None
+
+
+def test_sample():
+    sample = make_unique_fabric(partial(faker.random_element, ('a', 'b', 'c')))
+    assert isinstance(sample, Sample)
+    assert sorted(sample() for _ in range(3)) == ['a', 'b', 'c']
+
+    with pytest.raises(RuntimeError):
+        sample()
+
+
+def test_with_suffix():
+    assert with_suffix('lake', 12) == 'lake12'
+    assert with_suffix('lake', 12, 5) == 'lak12'
+    assert with_suffix('user@mail.com', 7) == 'user7@mail.com'
+    assert with_suffix('user@mail.com', 7, 12) == 'us7@mail.com'
+
+
+class SmallFactory(GenFactory):
+
+    """ Generate values from small spaces. """
+
+    generators = {
+        t.PositiveSmallInteger: partial(faker.random_int, 0, 199),
+    }
+
+
+class GenreFactory(GenFactory):
+
+    """ Generate genres from two choices. """
+
+    fakers = {
+        ('genre', str): partial(faker.random_element, ('pop', 'rock')),
+    }
+
+
+def test_mixer_unique_fabrics():
+    mixer = UniqueMixer(factory=SmallFactory)
+    smalls = mixer.cycle(200).blend(Small)
+    assert sorted(small.number for small in smalls) == list(range(200))
+    assert len(set(small.genre for small in smalls)) == 200
+    assert len(set(small.email for small in smalls)) == 200
+    assert all(small.email.count('@') == 1 for small in smalls)
+
+    with pytest.raises(RuntimeError):
+        mixer.blend(Small)
+
+    # Chunks of seeded and parallel runs get disjoint shards of the values
+    for workers in (None, 2):
+        mixer = UniqueMixer(factory=SmallFactory)
+        smalls = mixer.cycle(200, workers=workers, seed=1).blend(Small)
+        assert sorted(small.number for small in smalls) == list(range(200))
+
+    mixer = UniqueMixer(factory=GenreFactory)
+    smalls = mixer.cycle(2).blend(Small)
+    assert sorted(small.genre for small in smalls) == ['pop', 'rock']
+
+    with pytest.raises(RuntimeError):
+        mixer.blend(Small)
+
+    mixer.reset_unique(Small)
+    assert mixer.blend(Small).genre in ('pop', 'rock')
@@ -0,0 +1,140 @@
+""" Test vectorized generation. """
+import datetime
+import decimal
+import uuid
+from functools import partial
+
+import numpy as np
+import pytest
+
+from mixer import mix_types as t
+from mixer._faker import faker
+from mixer.factory import GenFactory
+from mixer.main import Mixer
+
+
+class Scheme:
+
+    """ Model scheme for columns. """
+
+    id = int
+    score = float
+    active = bool
+    created_at = datetime.date
+    updated_at = datetime.datetime
+    opened_at = datetime.time
+    price = decimal.Decimal
+    name = str
+    uid = t.UUID
+
+
+class Parent:
+
+    """ Model scheme with a relation. """
+
+    id = int
+    child = Scheme
+
+
+def test_blend_columns():
+    mixer = Mixer()
+    columns = mixer.blend_columns(Scheme, 100, name=mixer.sequence('name{0}'))
+    assert set(columns) == {
+        'id', 'score', 'active', 'created_at', 'updated_at', 'opened_at', 'price', 'name',
+        'uid'}
+
+    assert isinstance(columns['id'], np.ndarray)
+    assert len(columns['id']) == 100
+    assert 0 <= columns['id'].min() <= columns['id'].max() <= 9999
+    assert columns['active'].dtype == np.bool_
+    assert columns['created_at'].dtype == np.dtype('datetime64[D]')
+    assert columns['updated_at'].max() <= np.datetime64(datetime.datetime.utcnow())
+    assert columns['name'][:2] == ['name0', 'name1']
+    assert columns['opened_at'].max() < np.timedelta64(1, 'D')
+    assert isinstance(columns['price'][0], decimal.Decimal)
+    assert uuid.UUID(columns['uid'][0]).version == 4
+    assert len(set(columns['uid'])) == 100
+
+    columns = mixer.blend_columns(Scheme, 10 ** 4)
+    assert np.abs(columns['score']).max() > 10 ** 10
+
+    mixer.faker.seed_instance(42)
+    columns = mixer.blend_columns(Scheme, 10)
+    mixer.faker.seed_instance(42)
+    assert (mixer.blend_columns(Scheme, 10)['id'] == columns['id']).all()
+
+    columns = Mixer(seed=42).blend_columns(Scheme, 10)
+    seeded = Mixer(seed=42).blend_columns(Scheme, 10)
+    assert (seeded['id'] == columns['id']).all()
+    assert (seeded['score'] == columns['score']).all()
+    assert seeded['price'] == columns['price']
+
+
+def test_blend_columns_relations():
+    mixer = Mixer()
+    columns = mixer.blend_columns(Parent, 5)
+    assert list(columns) == ['id']
+
+    with pytest.raises(ValueError):
+        mixer.blend_columns(Parent, 5, child__name='name')
+
+
+def test_blend_columns_values():
+    mixer = Mixer()
+    columns = mixer.blend_columns(
+        Scheme, 3, id=7, score=mixer.SKIP, name=mixer.MIX.id(lambda id: 'name%s' % id))
+    assert columns['id'] == [7, 7, 7]
+    assert 'score' not in columns
+    assert columns['name'] == ['name7', 'name7', 'name7']
+
+
+class PriceFactory(GenFactory):
+
+    """ Generate prices with cents. """
+
+    generators = {
+        decimal.Decimal: partial(faker.small_decimal, right_digits=2),
+    }
+
+
+def test_decimals():
+    from mixer.vector import decimals
+
+    rng = np.random.default_rng(42)
+    values = decimals(rng, 1000, 2, 1)
+    assert all(abs(value) < 100 and value.as_tuple().exponent == -1 for value in values)
+    assert all(value > 0 for value in decimals(rng, 1000, 1, 1, positive=True))
+
+    values = decimals(rng, 1000, right_digits=2, min_value=-1, max_value=1)
+    assert all(-1 <= value <= 1 for value in values)
+    assert len(set(values)) > 100
+    assert all(value >= 5 for value in decimals(rng, 100, min_value=5))
+
+    mixer = Mixer(factory=PriceFactory)
+    columns = mixer.blend_columns(Scheme, 100)
+    assert all(value.as_tuple().exponent == -2 for value in columns['price'])
+
+
+def test_vector_factory():
+    from mixer.vector import Block, VectorFactory
+
+    mixer = Mixer(factory=VectorFactory)
+    schemes = mixer.cycle(10).blend(Scheme)
+    assert all(0 <= s.id <= 9999 and isinstance(s.id, int) for s in schemes)
+    assert all(isinstance(s.active, bool) for s in schemes)
+    assert all(isinstance(s.created_at, datetime.date) for s in schemes)
+    assert all(isinstance(s.updated_at, datetime.datetime) for s in schemes)
+    assert all(isinstance(s.opened_at, datetime.time) for s in schemes)
+    assert all(isinstance(s.price, decimal.Decimal) for s in schemes)
+    assert len(set(s.id for s in schemes)) > 1
+
+    assert isinstance(VectorFactory.get_fabric(int), Block)
+    assert not isinstance(VectorFactory.get_fabric(str), Block)
+
+    block = VectorFactory.get_fabric(decimal.Decimal).bind(left_digits=2, right_digits=1)
+    assert isinstance(block, Block)
+    assert all(abs(block()) < 100 and block().as_tuple().exponent == -1 for _ in range(10))
+
+    first = mixer.cycle(5, seed=42).blend(Scheme)
+    second = mixer.cycle(5, seed=42).blend(Scheme)
+    assert [s.score for s in first] == [s.score for s in second]